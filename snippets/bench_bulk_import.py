@@ -0,0 +1,311 @@
+"""Benchmarks for the LinkedIn importer on synthetic exports.
+
+Generates a seeded, realistic LinkedIn export with the requested number of
+rows per CSV, then times every convert_* function, update_json_file and a
+full run_import, reporting rows/sec and peak traced memory. Run from the
+repository root:
+
+    python3 -m snippets.bench_bulk_import --rows 1000 100000 1000000
+
+With --compare, the workload on the export described by a committed
+baseline is run several times and each stage's median time and peak memory
+are checked against the baseline; the command exits with status 1 if any
+stage regressed by more than --threshold:
+
+    python3 -m snippets.bench_bulk_import --compare snippets/bench_baseline.json
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from snippets.bulk_import_from_linkedin import (
+    MONTH_ABBREVIATIONS,
+    SECTIONS,
+    convert_section,
+    run_import,
+    update_json_file,
+)
+
+DEFAULT_ROWS = [1000, 100000, 1000000]
+
+# Rows per CSV of the export a new baseline is recorded on, and runs per comparison
+BASELINE_ROWS = 2000
+DEFAULT_REPEAT = 5
+# Slowdown or memory growth, as a fraction of the baseline, that fails --compare
+DEFAULT_THRESHOLD = 0.25
+# Timing differences below this many seconds are noise, whatever the ratio
+MIN_SECONDS_DELTA = 0.005
+
+COMPANIES = [
+    "Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries",
+    "Wayne Enterprises", "Hooli", "Pied Piper", "Vandelay Industries", "Cyberdyne",
+]
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Staff Engineer", "Engineering Manager",
+    "Data Scientist", "Product Manager", "Intern", "Technical Lead",
+]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "Polytechnic School"]
+DEGREES = ["Bachelor of Technology - BTech", "Master of Science - MS", "Bachelor of Arts - BA"]
+SKILLS = [
+    "Python (Programming Language)", "JavaScript (Programming Language)", "Go (Programming Language)",
+    "React", "Django", "Tailwind CSS", "Node.js", "Spring Boot", "TensorFlow", "Next.js",
+    "Git", "Docker", "Kubernetes", "AWS", "Linux", "PostgreSQL", "Figma", "Agile Methodologies",
+]
+PHRASES = [
+    "Led a team of {n} engineers", "Reduced p95 latency by {n}%", "Migrated services to v{n}.2",
+    "Shipped features used by {n}k users", "Improved test coverage to {n}%",
+    "Mentored {n} junior developers", "Designed APIs, e.g. billing and search",
+]
+
+HEADERS = {
+    "Education.csv": ["School Name", "Start Date", "End Date", "Notes", "Degree Name", "Activities"],
+    "Projects.csv": ["Title", "Description", "Url", "Started On", "Finished On"],
+    "Volunteering.csv": ["Company Name", "Role", "Cause", "Started On", "Finished On", "Description"],
+    "Honors.csv": ["Title", "Description", "Issued On"],
+    "Positions.csv": ["Company Name", "Title", "Description", "Location", "Started On", "Finished On"],
+    "Profile.csv": ["First Name", "Last Name", "Maiden Name", "Address", "Headline", "Summary"],
+    "Skills.csv": ["Name"],
+}
+
+
+def _month(rng, start_year=2005, end_year=2025):
+    return f"{rng.choice(MONTH_ABBREVIATIONS)} {rng.randint(start_year, end_year)}"
+
+
+def _description(rng, bullets=False):
+    items = [rng.choice(PHRASES).format(n=rng.randint(2, 90)) for _ in range(rng.randint(1, 6))]
+    if bullets:
+        return "\n".join(f"• {item}" for item in items)
+    return " ".join(f"{item}." for item in items)
+
+
+def _generate_rows(filename, rng, rows):
+    """Yield synthetic rows for one CSV of the export"""
+    if filename == "Profile.csv":
+        yield {"First Name": "Jane", "Last Name": "Doe", "Headline": "Software Engineer | Python | React"}
+        return
+
+    for i in range(rows):
+        if filename == "Education.csv":
+            start = rng.randint(2000, 2020)
+            yield {"School Name": rng.choice(SCHOOLS), "Start Date": str(start), "End Date": str(start + 4),
+                   "Notes": _description(rng), "Degree Name": rng.choice(DEGREES), "Activities": "Chess club"}
+        elif filename == "Projects.csv":
+            yield {"Title": f"Project {i}", "Description": _description(rng),
+                   "Url": f"https://github.com/example/project-{i}",
+                   "Started On": _month(rng), "Finished On": _month(rng) if rng.random() < 0.7 else ""}
+        elif filename == "Volunteering.csv":
+            yield {"Company Name": f"Community Org {i % 500}", "Role": "Mentor", "Cause": "Education",
+                   "Started On": _month(rng), "Finished On": _month(rng) if rng.random() < 0.6 else "",
+                   "Description": _description(rng)}
+        elif filename == "Honors.csv":
+            yield {"Title": f"Award {i}", "Description": _description(rng), "Issued On": _month(rng)}
+        elif filename == "Positions.csv":
+            yield {"Company Name": f"{rng.choice(COMPANIES)} {i % 1000}", "Title": rng.choice(TITLES),
+                   "Description": _description(rng, bullets=rng.random() < 0.5), "Location": "Remote",
+                   "Started On": _month(rng), "Finished On": _month(rng) if rng.random() < 0.8 else ""}
+        elif filename == "Skills.csv":
+            yield {"Name": rng.choice(SKILLS) if i < len(SKILLS) * 4 else f"{rng.choice(SKILLS)} {i}"}
+
+
+def generate_export(directory, rows, seed=0):
+    """Write a synthetic LinkedIn export with `rows` rows per CSV into directory"""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    for filename, headers in HEADERS.items():
+        with open(os.path.join(directory, filename), "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows(_generate_rows(filename, rng, rows))
+    return directory
+
+
+def _measure(function, measure_memory):
+    """Run function quietly and return (result, seconds, peak traced bytes)"""
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = function()
+            seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+    return result, seconds, peak
+
+
+def run_workload(input_dir, rows, measure_memory=True):
+    """Time every stage of an import of the export in input_dir.
+
+    Each converter writes its own JS file, so its time and memory do not
+    include splicing the output of the converters before it. Returns a dict
+    mapping stage names (convert_* function names, update_json_file and
+    run_import) to their seconds, row count and peak traced memory in bytes.
+    """
+    stages = {}
+    work_dir = tempfile.mkdtemp()
+    try:
+        output_file = os.path.join(work_dir, "index-example.js")
+        json_file = os.path.join(work_dir, "constants.json")
+
+        json_args = {}
+        for section in SECTIONS:
+            section_file = os.path.join(work_dir, f"{section.name}.js")
+            result, seconds, peak = _measure(
+                lambda: convert_section(section.name, input_dir, section_file), measure_memory
+            )
+            section_rows = 1 if section.csv_file == "Profile.csv" else rows
+            stages[f"convert_{section.label}_csv_to_js"] = {
+                "seconds": seconds, "rows": section_rows, "peak_bytes": peak
+            }
+            json_args[section.json_arg] = result
+
+        _, seconds, peak = _measure(lambda: update_json_file(json_file=json_file, **json_args), measure_memory)
+        stages["update_json_file"] = {"seconds": seconds, "rows": rows * (len(SECTIONS) - 1), "peak_bytes": peak}
+
+        os.remove(json_file)
+        _, seconds, peak = _measure(lambda: run_import(input_dir, output_file, json_file), measure_memory)
+        stages["run_import"] = {"seconds": seconds, "rows": rows * (len(SECTIONS) - 1) + 1, "peak_bytes": peak}
+    finally:
+        shutil.rmtree(work_dir)
+    return stages
+
+
+def measure_workload(rows, seed=0, repeat=DEFAULT_REPEAT):
+    """Run the workload on a seeded export and return the median of every stage.
+
+    Timings are the medians of `repeat` runs without tracemalloc, which slows
+    the converters down; peak memory comes from one extra traced run, as it
+    is deterministic for a seeded export.
+    """
+    export_dir = tempfile.mkdtemp()
+    try:
+        generate_export(export_dir, rows, seed=seed)
+        runs = [run_workload(export_dir, rows, measure_memory=False) for _ in range(repeat)]
+        traced = run_workload(export_dir, rows, measure_memory=True)
+    finally:
+        shutil.rmtree(export_dir)
+
+    return {
+        stage: {
+            "seconds": statistics.median(run[stage]["seconds"] for run in runs),
+            "rows": timing["rows"],
+            "peak_bytes": timing["peak_bytes"],
+        }
+        for stage, timing in traced.items()
+    }
+
+
+def compare_to_baseline(baseline, stages, threshold=DEFAULT_THRESHOLD):
+    """Compare measured stages with the stages of a baseline.
+
+    Returns (lines, regressions): a per-stage diff table, and the names of the
+    stages whose time or peak memory grew by more than `threshold` or that
+    the workload no longer has.
+    """
+    lines = [f"{'stage':<36}{'base s':>9}{'now s':>9}{'time':>8}{'base MiB':>10}{'now MiB':>9}{'mem':>8}"]
+    regressions = []
+    for stage in list(baseline) + [stage for stage in stages if stage not in baseline]:
+        if stage not in stages:
+            lines.append(f"{stage:<36}  missing from the workload")
+            regressions.append(stage)
+            continue
+        if stage not in baseline:
+            lines.append(f"{stage:<36}  new stage, not in the baseline")
+            continue
+
+        before, after = baseline[stage], stages[stage]
+        time_change = after["seconds"] / before["seconds"] - 1 if before["seconds"] else 0.0
+        memory_change = after["peak_bytes"] / before["peak_bytes"] - 1 if before["peak_bytes"] else 0.0
+        slower = time_change > threshold and after["seconds"] - before["seconds"] > MIN_SECONDS_DELTA
+        larger = memory_change > threshold
+        if slower or larger:
+            regressions.append(stage)
+        lines.append(
+            f"{stage:<36}{before['seconds']:>9.3f}{after['seconds']:>9.3f}{time_change:>+8.0%}"
+            f"{before['peak_bytes'] / 2 ** 20:>10.1f}{after['peak_bytes'] / 2 ** 20:>9.1f}{memory_change:>+8.0%}"
+            + ("  REGRESSED" if slower or larger else "")
+        )
+    return lines, regressions
+
+
+def format_report(rows, stages):
+    """Format the stages of one workload as a table"""
+    lines = [f"\n{rows:,} rows per CSV",
+             f"{'stage':<36}{'seconds':>10}{'rows/sec':>14}{'peak MiB':>10}"]
+    for stage, timing in stages.items():
+        rate = timing["rows"] / timing["seconds"] if timing["seconds"] else float("inf")
+        peak = "-" if timing["peak_bytes"] is None else f"{timing['peak_bytes'] / 2 ** 20:.1f}"
+        lines.append(f"{stage:<36}{timing['seconds']:>10.3f}{rate:>14,.0f}{peak:>10}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the LinkedIn importer on synthetic exports')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help='Rows per CSV for each workload')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the export generator')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip tracemalloc, which slows the converters down')
+    parser.add_argument('--json', help='Also write the results as JSON to this path')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='Compare median stage timings and peak memory with a baseline JSON file')
+    parser.add_argument('--write-baseline', metavar='PATH',
+                        help=f'Record a baseline for --compare on a {BASELINE_ROWS:,}-row export')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Runs whose median is compared or recorded as the baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Fractional slowdown or memory growth of a stage that fails --compare')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        stages = measure_workload(baseline["rows"], seed=baseline["seed"], repeat=args.repeat)
+        lines, regressions = compare_to_baseline(baseline["stages"], stages, args.threshold)
+        print(f"{baseline['rows']:,} rows per CSV, median of {args.repeat} runs, threshold {args.threshold:.0%}")
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+            raise SystemExit(1)
+        print("\nNo stage regressed.")
+        return
+
+    if args.write_baseline:
+        stages = measure_workload(BASELINE_ROWS, seed=args.seed, repeat=args.repeat)
+        baseline = {"rows": BASELINE_ROWS, "seed": args.seed, "repeat": args.repeat, "stages": stages}
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=4)
+            f.write("\n")
+        print(format_report(BASELINE_ROWS, stages))
+        return
+
+    results = {}
+    for rows in args.rows:
+        export_dir = tempfile.mkdtemp()
+        try:
+            generate_export(export_dir, rows, seed=args.seed)
+            stages = run_workload(export_dir, rows, measure_memory=not args.no_memory)
+        finally:
+            shutil.rmtree(export_dir)
+        results[str(rows)] = stages
+        print(format_report(rows, stages))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Micro-benchmarks for the shared description tokenizer.
+
+Compares split_description() with the split-on-every-period logic the
+converters used before it. Run from the repository root:
+
+    python3 -m snippets.bench_description_tokenizer
+"""
+import argparse
+import timeit
+
+from snippets.description_tokenizer import split_description
+
+
+def legacy_split_description(description, bullets=False):
+    """The description splitting previously duplicated in each converter"""
+    if bullets and "•" in description:
+        return [item.strip() for item in description.split("•") if item.strip()]
+
+    # Split by period but keep the period in the text
+    sentences = [s.strip() + "." for s in description.split(".") if s.strip()]
+    # Remove the last period if the original text didn't end with a period
+    if not description.endswith(".") and sentences:
+        sentences[-1] = sentences[-1][:-1]
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+SAMPLES = {
+    "short": "Mentored junior developers. Conducted code reviews.",
+    "bullets": "\n".join(f"• Delivered feature {i} used by 10k users" for i in range(12)),
+    "technical": (
+        "Migrated the API to Python 3.11 and Django 4.2, e.g. async views and typed settings. "
+        "Cut p95 latency by 2.5x, see https://example.com/blog/perf.html for details. "
+        "Maintained v1.2.3 through v2.0.0 of the SDK. "
+    ) * 8,
+    "long": "Worked on distributed systems and data pipelines for analytics. " * 200,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the description tokenizer')
+    parser.add_argument('--number', type=int, default=2000, help='Calls per sample and implementation')
+    args = parser.parse_args()
+
+    print(f"{'sample':<12}{'chars':>8}{'legacy us':>12}{'current us':>12}{'speedup':>10}")
+    for name, text in SAMPLES.items():
+        timings = []
+        for split in (legacy_split_description, split_description):
+            seconds = timeit.timeit(lambda: split(text, bullets=True), number=args.number)
+            timings.append(seconds / args.number * 1e6)
+        legacy, current = timings
+        print(f"{name:<12}{len(text):>8}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,45 @@ import csv
 import re
 import json
 import argparse
+import array
+import gzip
+import hashlib
+import heapq
+import io
+import mmap
+import multiprocessing
+import operator
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import groupby, repeat
+from socketserver import ThreadingMixIn, UnixStreamServer
 from datetime import datetime
 
+try:
+    import brotli
+except ImportError:  # Optional: .br artifacts are only written when it is installed
+    brotli = None
+
+try:
+    from snippets.description_tokenizer import split_description, split_sentences
+except ImportError:  # Run as a script, with snippets/ itself on sys.path
+    from description_tokenizer import split_description, split_sentences
+
+# Bump when a change to the importer alters its rendered output, so that
+# incremental runs do not reuse sections produced by an older version.
+TOOL_VERSION = "1.3.0"
+
 
 def get_default_paths():
     """Get default paths for input and output files"""
@@ -12,1034 +49,2330 @@ def get_default_paths():
     return {
         'input_dir': os.path.join(script_dir, "linkedin-export"),
         'output': os.path.join(script_dir, "..", "src", "constants", "index-example.js"),
-        'json_output': os.path.join(script_dir, "constants.json")
+        'json_output': os.path.join(script_dir, "constants.json"),
+        'skill_taxonomy': os.path.join(script_dir, "skill_taxonomy.json")
     }
 
 
+# Month abbreviations used in LinkedIn dates. A fixed table keeps parsing
+# independent of the process locale, unlike strptime('%b').
+MONTH_ABBREVIATIONS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+_MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(MONTH_ABBREVIATIONS, 1)}
+_MONTH_YEAR = re.compile(r"\s*([A-Za-z]{3})\s+(\d{4})\s*$")
+
+# Sort keys standing in for datetime.min and the far-future end of "Present"
+_MIN_DATE_KEY = (1, 1, 1)
+_PRESENT_DATE_KEY = (9999, 12, 31)
+
+
+@lru_cache(maxsize=4096)
+def parse_month_year(date_str):
+    """Parse a 'MMM YYYY' string into a (year, month) tuple, or None"""
+    match = _MONTH_YEAR.match(date_str)
+    if not match:
+        return None
+    month = _MONTH_NUMBERS.get(match.group(1).lower())
+    year = int(match.group(2))
+    if month is None or year < 1:
+        return None
+    return year, month
+
+
 def parse_date(date_str):
     """Parse date string in format 'MMM YYYY' to datetime object"""
     if not date_str:
         return None
-    try:
-        return datetime.strptime(date_str.strip(), '%b %Y')
-    except ValueError:
+    parsed = parse_month_year(date_str)
+    if parsed is None:
         return None
+    return datetime(parsed[0], parsed[1], 1)
 
 
+@lru_cache(maxsize=4096)
 def format_date(date_str):
-    """Format date string to 'MMM YYYY' format"""
+    """Format date string to 'MMM YYYY' format, leaving unparseable dates as they are"""
     if not date_str:
         return ""
-    try:
-        date = parse_date(date_str)
-        return date.strftime('%b %Y')
-    except (ValueError, TypeError):
+    parsed = parse_month_year(date_str)
+    if parsed is None:
         return date_str
+    year, month = parsed
+    return f"{MONTH_ABBREVIATIONS[month - 1]} {year}"
 
 
-def convert_education_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
+@lru_cache(maxsize=4096)
+def date_sort_key(started_on, finished_on):
+    """Sort key for a date range, most recent last.
 
-    input_file = os.path.join(input_dir, "Education.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
+    Orders like comparing (start, end) datetimes, with a missing end date
+    treated as the far future and a missing start date as datetime.min.
+    """
+    started = parse_month_year(started_on)
+    if started is None:
+        return _MIN_DATE_KEY, _MIN_DATE_KEY
+    finished = parse_month_year(finished_on)
+    return started + (1,), finished + (1,) if finished else _PRESENT_DATE_KEY
 
-    # Read education data from CSV
-    education_entries = []
-    try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for i, row in enumerate(reader):
-                # Extract data
-                school_name = row.get("School Name", "").strip()
-                start_date = row.get("Start Date", "").strip()
-                end_date = row.get("End Date", "").strip()
-                notes = row.get("Notes", "").strip()
-                degree_name = row.get("Degree Name", "").strip()
-                activities = row.get("Activities", "").strip()
-
-                # Format duration
-                duration = ""
-                if start_date and end_date:
-                    duration = f"{start_date} - {end_date}"
-                elif start_date:
-                    duration = f"{start_date} - Present"
-
-                # Create entry
-                entry = {
-                    "id": f"education-{i + 1}",
-                    "icon": "FaRegImage",
-                    "title": school_name,
-                    "degree": degree_name,
-                    "duration": duration,
-                    "content1": notes,
-                    "content2": activities,
-                }
-
-                education_entries.append(entry)
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
+def is_export_archive(input_dir):
+    """Whether the input is a LinkedIn export ZIP rather than a directory"""
+    return os.path.isfile(input_dir) and zipfile.is_zipfile(input_dir)
+
+
+def find_export_member(archive, filename):
+    """Name of the archive member for a CSV, which may sit in a subdirectory"""
+    matches = [
+        name for name in archive.namelist()
+        if name.rsplit("/", 1)[-1] == filename
+    ]
+    return min(matches, key=len) if matches else None
+
+
+def export_file_exists(input_dir, filename):
+    """Whether the export directory or ZIP contains the given CSV"""
+    if is_export_archive(input_dir):
+        with zipfile.ZipFile(input_dir) as archive:
+            return find_export_member(archive, filename) is not None
+    return os.path.exists(os.path.join(input_dir, filename))
+
+
+@contextmanager
+def open_export_file(input_dir, filename):
+    """Open a CSV of the export for reading as text.
+
+    ZIP members are streamed and decoded on the fly without being extracted.
+    """
+    if is_export_archive(input_dir):
+        with zipfile.ZipFile(input_dir) as archive:
+            member = find_export_member(archive, filename)
+            if member is None:
+                raise FileNotFoundError(f"{filename} not found in {input_dir}")
+            with archive.open(member) as raw:
+                yield io.TextIOWrapper(raw, encoding="utf-8")
+    else:
+        with open(os.path.join(input_dir, filename), "r", encoding="utf-8") as f:
+            yield f
+
+
+def export_file_size(input_dir, filename):
+    """Uncompressed size of a CSV of the export, or 0 if it is missing"""
+    if is_export_archive(input_dir):
+        with zipfile.ZipFile(input_dir) as archive:
+            member = find_export_member(archive, filename)
+            return archive.getinfo(member).file_size if member else 0
+    path = os.path.join(input_dir, filename)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+# Tokens that matter when locating top-level exports in a JS file. Strings,
+# template literals and comments are matched whole so that brackets or
+# semicolons inside them are never mistaken for code. The leading lookahead
+# lets the regex engine skip other characters quickly, and tokens are told
+# apart by their first character instead of named groups.
+_JS_TOKEN = re.compile(r"""(?=["'`/\[\]{}();e])(?:
+    "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+  | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+  | `[^`\\]*(?:\\.[^`\\]*)*`
+  | //[^\n]*
+  | /\*[\s\S]*?\*/
+  | (?<![\w$])export\s+const\s+([A-Za-z_$][\w$]*)\s*=
+  | [\[\]{}();]
+)""", re.VERBOSE)
+_JS_OPEN = frozenset("[{(")
+_JS_CLOSE = frozenset("]})")
+
+
+def index_js_sections(content):
+    """Map each top-level `export const` name to its (start, end) offsets.
+
+    The file is tokenized once, tracking strings, comments and bracket depth.
+    A section runs from `export` up to and including the `;` that ends the
+    statement at depth 0, or up to the next export / end of file if the
+    semicolon is missing.
+    """
+    index = {}
+    depth = 0
+    current = None
+
+    def close_current(end):
+        name, start = current
+        end = start + len(content[start:end].rstrip())
+        index.setdefault(name, (start, end))
+
+    for match in _JS_TOKEN.finditer(content):
+        char = content[match.start()]
+        if char in _JS_OPEN:
+            depth += 1
+        elif char in _JS_CLOSE:
+            if depth:
+                depth -= 1
+        elif char == ";":
+            if depth == 0 and current:
+                index.setdefault(current[0], (current[1], match.end()))
+                current = None
+        elif char == "e" and depth == 0:
+            if current:
+                close_current(match.start())
+            current = (match.group(1), match.start())
+
+    if current:
+        close_current(len(content))
+    return index
+
+
+def iter_splice_js_sections(content, sections):
+    """Yield the pieces of JS source with each rendered section spliced in.
+
+    `content` is the existing file content, or None if the file does not exist
+    yet. `sections` maps export names to rendered JS code, or to functions
+    that write it to a file handle; those are yielded for the caller to call
+    with its file. Existing sections are replaced in place using a single
+    index of the file; new ones are appended in order.
+    """
+    pending = list(sections.items())
+    if content is None:
+        # Start a new file with the sections in order
+        for position, (name, js_code) in enumerate(pending):
+            if position:
+                yield "\n\n"
+            yield js_code
+        return
+
+    index = index_js_sections(content)
+    replacements = sorted(
+        (index[name], js_code) for name, js_code in pending if name in index
+    )
+
+    position = 0
+    for (start, end), js_code in replacements:
+        yield content[position:start]
+        if callable(js_code):
+            yield lambda out, write_js=js_code: write_js(StrippedWriter(out))
+        else:
+            yield js_code.strip()
+        position = end
+    yield content[position:]
+
+    # Append sections that are not defined yet
+    for name, js_code in pending:
+        if name not in index:
+            yield "\n\n"
+            yield js_code
+
+
+class StrippedWriter:
+    """A file-like wrapper that drops the leading and trailing whitespace of what is written"""
+
+    def __init__(self, out):
+        self.out = out
+        self.started = False
+        # Whitespace held back until more text shows it is not trailing
+        self.pending = ""
+
+    def write(self, text):
+        if not self.started:
+            text = text.lstrip()
+            self.started = bool(text)
+        body = text.rstrip()
+        if body:
+            self.out.write(self.pending + body)
+            self.pending = text[len(body):]
+        else:
+            self.pending += text
 
-    # Generate JS code for education list
-    js_entries = []
-    for entry in education_entries:
-        template = '''  {
-    id: "%s",
-    icon: %s,
-    title: "%s",
-    degree: "%s",
-    duration: "%s",
-    content1: "%s",
-    content2: "%s"
-  }'''
-        js_entry = template % (
-            entry["id"],
-            entry["icon"],
-            entry["title"],
-            entry["degree"],
-            entry["duration"],
-            entry["content1"],
-            entry["content2"]
-        )
-        js_entries.append(js_entry)
 
-    js_code = "export const educationList = [\n" + ",\n".join(js_entries) + "\n];\n"
+def splice_js_sections(content, sections):
+    """Replace or append each rendered `export const` section in JS source"""
+    out = io.StringIO()
+    write_splice_js_sections(out, content, sections)
+    return out.getvalue()
 
-    # Check if output file exists and contains relevant section
+
+def write_splice_js_sections(out, content, sections):
+    """Write the pieces of iter_splice_js_sections to a file handle"""
+    for piece in iter_splice_js_sections(content, sections):
+        if callable(piece):
+            piece(out)
+        else:
+            out.write(piece)
+
+
+def same_file_content(path, other_path):
+    """Whether two files hold the same bytes"""
+    if os.path.getsize(path) != os.path.getsize(other_path):
+        return False
+    with open(path, "rb") as f, open(other_path, "rb") as other:
+        while True:
+            chunk = f.read(1 << 20)
+            if chunk != other.read(1 << 20):
+                return False
+            if not chunk:
+                return True
+
+
+def write_file_atomic(path, content):
+    """Write content through a temp file and rename.
+
+    `content` is bytes, a string, an iterable of strings or a function that
+    writes to the open text file.
+
+    If the file already holds exactly that content it is left untouched,
+    keeping its mtime so that dev servers and build caches see no change.
+    Returns True if the file was written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    # Keep the permissions of the file being replaced
+    if os.path.exists(path):
+        mode = os.stat(path).st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
     try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if educationList is already defined
-            if "export const educationList" in content:
-                # Replace existing educationList
-                pattern = r"export const educationList = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append educationList to the end
-                content += "\n\n" + js_code
+        if isinstance(content, bytes):
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
         else:
-            # Create new file with educationList
-            content = js_code
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if isinstance(content, str):
+                    f.write(content)
+                elif callable(content):
+                    content(f)
+                else:
+                    f.writelines(content)
+        if os.path.exists(path) and same_file_content(temp_path, path):
+            os.remove(temp_path)
+            return False
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_text_file(path):
+    """Return the content of a text file, or None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+def write_js_sections(output_file, sections, content=False, report=None):
+    """Splice rendered sections into the JS file with a single read and write.
 
-        print(f"Successfully updated {output_file} with education data.")
-        return education_entries
+    `sections` is as for iter_splice_js_sections, so sections can be rendered
+    straight into the file. Pass `content` to reuse file content the caller
+    has already read. The splice is recorded as the "splice_write" stage of
+    `report`, if given. Sections rendered straight into the file record
+    their own "render" stages, whose time is left out of splice_write.
+    """
+    if report is None:
+        report = RunReport(enabled=False)
+
+    section = next(iter(sections)) if len(sections) == 1 else "all"
+    try:
+        with report.stage(section, "splice_write") as stage:
+            nested = len(report.stages)
+            if content is False:
+                content = read_text_file(output_file)
+
+            write_file_atomic(output_file, lambda out: write_splice_js_sections(out, content, sections))
+            stage["bytes_written"] = os.path.getsize(output_file)
+        stage["seconds"] -= sum(record["seconds"] for record in report.stages[nested:])
+        return True
 
     except Exception as e:
         print(f"Error updating JS file: {e}")
         return False
 
 
-def convert_projects_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
+def write_js_modules(modules_dir, sections, import_content=None, import_file=None, report=None):
+    """Write each rendered section to its own ES module and rewrite the barrel.
 
-    input_file = os.path.join(input_dir, "Projects.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
+    `sections` maps export names to rendered JS code. Identifiers a section
+    uses are imported the way `import_content`, the source of the monolithic
+    JS file at `import_file`, imports them. modules_dir/index.js re-exports
+    every section module in modules_dir, so the site can import from the
+    barrel or lazy-load a single section with `import("./<name>.js")`.
+    The writes are recorded as the "module_write" stage of `report`, if given.
+    """
+    if report is None:
+        report = RunReport(enabled=False)
 
-    # Read projects data from CSV
-    project_entries = []
+    section = next(iter(sections)) if len(sections) == 1 else "all"
     try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for i, row in enumerate(reader):
-                # Extract data
-                title = row.get("Title", "").strip()
-                description = row.get("Description", "").strip()
-                url = row.get("Url", "").strip()
-                # started_on = row.get("Started On", "").strip()
-                # finished_on = row.get("Finished On", "").strip()
-
-                # Create entry
-                entry = {
-                    "id": f"project-{i + 1}",
-                    "title": title,
-                    "github": url,
-                    "link": url,
-                    "image": "placeholder",
-                    "content": description,
-                    "stack": [
-                        {
-                            "id": "icon-1",
-                            "icon": "FaRegImage",
-                            "name": "Placeholder",
-                        }
-                    ],
-                }
-
-                project_entries.append(entry)
+        with report.stage(section, "module_write") as stage:
+            imports = index_js_imports(import_content)
+            source_dir = os.path.dirname(os.path.abspath(import_file or modules_dir))
+            modules_dir = os.path.abspath(modules_dir)
+            for name, js_code in sections.items():
+                module = render_js_module(js_code, imports, source_dir, modules_dir)
+                write_file_atomic(js_module_path(modules_dir, name), module)
+                stage["bytes_written"] += len(module.encode("utf-8"))
+
+            barrel = "".join(
+                f'export {{ {known.name} }} from "./{known.name}.js";\n'
+                for known in SECTIONS if os.path.exists(js_module_path(modules_dir, known.name))
+            )
+            write_file_atomic(js_module_path(modules_dir, "index"), barrel)
+            stage["bytes_written"] += len(barrel.encode("utf-8"))
+        return True
 
     except Exception as e:
-        print(f"Error reading CSV file: {e}")
+        print(f"Error writing JS modules: {e}")
         return False
 
-    # Generate JS code for projects list
-    js_entries = []
-    for entry in project_entries:
+
+def output_js_files(output_file, modules_dir=None):
+    """The JS files an import writes: the JS file, or the section modules and barrel"""
+    if modules_dir is None:
+        return [output_file]
+    return [js_module_path(modules_dir, name) for name in [section.name for section in SECTIONS] + ["index"]]
+
+
+# `import { a, b as c } from "x"` and `import d from "y"` statements
+_JS_IMPORT = re.compile(
+    r"""^import\s+(?:\{([^}]*)\}|([A-Za-z_$][\w$]*))\s+from\s+(["'])([^"'\n]+)\3\s*;?""", re.MULTILINE
+)
+# Unquoted property values in rendered sections, such as `icon: FaRegImage,`
+_JS_IDENTIFIER_VALUE = re.compile(r"^\s*[\w$]+: ([A-Za-z_$][\w$]*),?$", re.MULTILINE)
+
+
+def index_js_imports(content):
+    """Map each identifier imported by JS source to (module specifier, import clause).
+
+    The clause is what goes between the braces of a named import, such as
+    `a` or `b as c`, or None for a default import.
+    """
+    imports = {}
+    for match in _JS_IMPORT.finditer(content or ""):
+        named, default, _, source = match.groups()
+        if default:
+            imports.setdefault(default, (source, None))
+            continue
+        for clause in named.split(","):
+            clause = " ".join(clause.split())
+            if clause:
+                imports.setdefault(clause.split(" as ")[-1], (source, clause))
+    return imports
+
+
+def js_module_path(modules_dir, name):
+    """Path of the ES module of a section, or of the barrel for name="index" """
+    return os.path.join(modules_dir, f"{name}.js")
+
+
+def render_js_module(js_code, imports, source_dir, modules_dir):
+    """Return a rendered section as an ES module that imports what it uses.
+
+    `imports` comes from index_js_imports of a file in `source_dir`; relative
+    specifiers are rebased onto `modules_dir`.
+    """
+    used = set(_JS_IDENTIFIER_VALUE.findall(js_code))
+    by_source = {}
+    for identifier, (source, clause) in imports.items():
+        if identifier in used:
+            by_source.setdefault(source, []).append((identifier, clause))
+
+    lines = []
+    for source, bindings in by_source.items():
+        if source.startswith("."):
+            source = os.path.relpath(os.path.join(source_dir, source), modules_dir).replace(os.sep, "/")
+            if not source.startswith("."):
+                source = "./" + source
+        for identifier, clause in bindings:
+            if clause is None:
+                lines.append(f'import {identifier} from "{source}";')
+        named = [clause for _, clause in bindings if clause is not None]
+        if named:
+            lines.append(f'import {{ {", ".join(named)} }} from "{source}";')
+
+    header = "\n".join(lines) + "\n\n" if lines else ""
+    return f"{header}{js_code.strip()}\n"
+
+
+# JS string literals are written as JSON strings; the C-accelerated encoder
+# escapes quotes, backslashes and control characters
+js_string = json.encoder.encode_basestring
+
+
+class Record:
+    """Base of the typed records that make up the sections.
+
+    FIELDS lists the fields in output order. Values that differ per entry
+    live in __slots__; values the importer writes identically for every
+    entry, such as placeholder icons, are class attributes, so no entry
+    stores them. Records can also be read like the dicts they replace
+    (record["title"], record.get(), dict(record)) and compare equal to them.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+    # Fields holding a list of nested records
+    RECORD_LISTS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._values = operator.attrgetter(*cls.FIELDS)
+
+    def to_json(self):
+        """Return the fields as a dict; nested records are left to the JSON encoder"""
+        return dict(zip(self.FIELDS, self._values(self)))
+
+    def to_plain(self):
+        """Return the fields as a dict, with nested records turned into dicts too"""
+        data = dict(zip(self.FIELDS, self._values(self)))
+        for field in self.RECORD_LISTS:
+            data[field] = [item.to_plain() for item in data[field]]
+        return data
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def keys(self):
+        return self.FIELDS
+
+    def items(self):
+        return zip(self.FIELDS, self._values(self))
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return plain_data(self) == plain_data(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({plain_data(self)!r})"
+
+
+def plain_data(value):
+    """Return section data with records turned into dicts and lists, recursively"""
+    if isinstance(value, Record):
+        return value.to_plain()
+    if isinstance(value, dict):
+        return {key: plain_data(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain_data(item) for item in value]
+    return value
+
+
+def record_json(value):
+    """`default` hook of the JSON encoders, which serializes records as dicts"""
+    if isinstance(value, Record):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ContentItem(Record):
+    """A sentence or bullet point of a volunteering role or position"""
+
+    __slots__ = ("text",)
+    FIELDS = ("text", "link")
+    link = ""
+
+    def __init__(self, text):
+        self.text = text
+
+
+def write_js_array(out, name, items, render_item, cache=None):
+    """Write `export const name = [...]` to out one rendered item at a time.
+
+    With a FragmentCache, items whose ID was rendered before are reused
+    instead of rendered again.
+    """
+    if cache is None:
+        fragments = map(render_item, items)
+    else:
+        fragments = cache.iter_fragments(name, items, render_item)
+    out.write(f"export const {name} = [\n")
+    for i, fragment in enumerate(fragments):
+        if i:
+            out.write(",\n")
+        out.write(fragment)
+    out.write("\n];\n")
+
+
+def content_id(prefix, fields, seen):
+    """Return an ID derived from the field values of a record.
+
+    Unlike a row number, the ID only changes when the record does, so
+    inserting a row keeps the IDs of all others. `seen` counts the IDs handed
+    out so far in a section; repeated records get a -2, -3... suffix.
+    """
+    digest = hashlib.sha256("\x1f".join(fields).encode("utf-8")).hexdigest()[:12]
+    record_id = f"{prefix}-{digest}"
+    count = seen.get(record_id, 0) + 1
+    seen[record_id] = count
+    return record_id if count == 1 else f"{record_id}-{count}"
+
+
+# Rendered entries kept by a FragmentCache before the least recently used are evicted
+FRAGMENT_CACHE_SIZE = 200000
+
+
+class FragmentCache:
+    """Disk-backed LRU cache of rendered JS entries, keyed by section and entry ID.
+
+    The cache is only correct for content-addressed IDs (stable_ids=True),
+    where an ID identifies the content it was rendered from. Each section is
+    kept in its own pickle under `cache_dir`, so parallel section builders
+    never share a file. Fragments are dropped when TOOL_VERSION changes,
+    since the renderers may have.
+    """
+
+    def __init__(self, cache_dir, max_entries=FRAGMENT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, section):
+        return os.path.join(self.cache_dir, f"{section}.pickle")
+
+    def load(self, section):
+        """Return the cached {id: fragment} of a section, least recently used first"""
+        try:
+            with open(self._path(section), "rb") as f:
+                version, fragments = pickle.load(f)
+        except Exception:
+            # A missing or corrupt cache file is simply rebuilt
+            return {}
+        return fragments if version == TOOL_VERSION else {}
+
+    def iter_fragments(self, section, items, render_item):
+        """Yield each item rendered by render_item, reusing cached fragments.
+
+        Once all items are rendered, new fragments are saved with the ones
+        used in this run moved to the most recently used end; the least
+        recently used beyond `max_entries` are evicted. A run without new
+        fragments leaves the file untouched.
+        """
+        cached = self.load(section)
+        used = {}
+        misses = 0
+        for item in items:
+            fragment = cached.get(item.id)
+            if fragment is None:
+                fragment = render_item(item)
+                misses += 1
+            used[item.id] = fragment
+            yield fragment
+
+        self.hits += len(used) - misses
+        self.misses += misses
+        if not misses:
+            return
+
+        fragments = {key: fragment for key, fragment in cached.items() if key not in used}
+        fragments.update(used)
+        if len(fragments) > self.max_entries:
+            fragments = dict(list(fragments.items())[len(fragments) - self.max_entries:])
+        os.makedirs(self.cache_dir, exist_ok=True)
+        write_file_atomic(self._path(section),
+                          pickle.dumps((TOOL_VERSION, fragments), protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def education_entries_from_rows(rows, stable_ids=False):
+    """Build the `educationList` entries from Education.csv rows.
+
+    With stable_ids=True entry IDs are derived from their content rather than
+    their row number.
+    """
+    education_entries = []
+    seen = {}
+    for i, row in enumerate(rows):
+        # Extract data
+        school_name = row.get("School Name", "").strip()
+        start_date = row.get("Start Date", "").strip()
+        end_date = row.get("End Date", "").strip()
+        notes = row.get("Notes", "").strip()
+        degree_name = row.get("Degree Name", "").strip()
+        activities = row.get("Activities", "").strip()
+
+        # Format duration
+        duration = ""
+        if start_date and end_date:
+            duration = f"{start_date} - {end_date}"
+        elif start_date:
+            duration = f"{start_date} - Present"
+
+        # Create entry
+        entry = EducationEntry(
+            content_id("education", (school_name, start_date, end_date, notes, degree_name, activities),
+                       seen) if stable_ids else f"education-{i + 1}",
+            school_name,
+            degree_name,
+            duration,
+            notes,
+            activities,
+        )
+
+        education_entries.append(entry)
+
+    return education_entries
+
+
+class EducationEntry(Record):
+    """An `educationList` entry"""
+
+    __slots__ = ("id", "title", "degree", "duration", "content1", "content2")
+    FIELDS = ("id", "icon", "title", "degree", "duration", "content1", "content2")
+    icon = "FaRegImage"
+
+    def __init__(self, id, title, degree, duration, content1, content2):
+        self.id = id
+        self.title = title
+        self.degree = degree
+        self.duration = duration
+        self.content1 = content1
+        self.content2 = content2
+
+    def to_js(self):
+        """Render the entry as JS"""
+        template = '''  {
+    id: %s,
+    icon: %s,
+    title: %s,
+    degree: %s,
+    duration: %s,
+    content1: %s,
+    content2: %s
+  }'''
+        return template % (
+            js_string(self.id),
+            self.icon,
+            js_string(self.title),
+            js_string(self.degree),
+            js_string(self.duration),
+            js_string(self.content1),
+            js_string(self.content2)
+        )
+
+
+def write_education_js(education_entries, out, cache=None):
+    """Write the `educationList` export to out"""
+    write_js_array(out, "educationList", education_entries, EducationEntry.to_js, cache)
+
+
+def project_entries_from_rows(rows, stable_ids=False):
+    """Build the `projects` entries from Projects.csv rows.
+
+    With stable_ids=True entry IDs are derived from their content rather than
+    their row number.
+    """
+    project_entries = []
+    seen = {}
+    for i, row in enumerate(rows):
+        # Extract data
+        title = row.get("Title", "").strip()
+        description = row.get("Description", "").strip()
+        url = row.get("Url", "").strip()
+        # started_on = row.get("Started On", "").strip()
+        # finished_on = row.get("Finished On", "").strip()
+
+        # Create entry
+        entry = ProjectEntry(
+            content_id("project", (title, description, url), seen) if stable_ids else f"project-{i + 1}",
+            title,
+            url,
+            url,
+            description,
+        )
+
+        project_entries.append(entry)
+
+    return project_entries
+
+
+class StackItem(Record):
+    """A technology in the stack of a project"""
+
+    __slots__ = ("id", "icon", "name")
+    FIELDS = ("id", "icon", "name")
+
+    def __init__(self, id, icon, name):
+        self.id = id
+        self.icon = icon
+        self.name = name
+
+
+class ProjectEntry(Record):
+    """A `projects` entry"""
+
+    __slots__ = ("id", "title", "github", "link", "content")
+    FIELDS = ("id", "title", "github", "link", "image", "content", "stack")
+    RECORD_LISTS = ("stack",)
+    image = "placeholder"
+    stack = (StackItem("icon-1", "FaRegImage", "Placeholder"),)
+
+    def __init__(self, id, title, github, link, content):
+        self.id = id
+        self.title = title
+        self.github = github
+        self.link = link
+        self.content = content
+
+    def to_js(self):
+        """Render the entry as JS"""
         # Format stack items
         stack_items = []
-        for stack in entry["stack"]:
+        for stack in self.stack:
             stack_template = '''      {
-            id: "%s",
+            id: %s,
             icon: %s,
-            name: "%s"
+            name: %s
         }'''
             stack_item = stack_template % (
-                stack["id"],
-                stack["icon"],
-                stack["name"]
+                js_string(stack.id),
+                stack.icon,
+                js_string(stack.name)
             )
             stack_items.append(stack_item)
 
-        stack_items_str = ",\n".join(stack_items)  # Precompute the string here
-
         template = '''  {
-        id: "%s",
-        title: "%s",
-        github: "%s",
-        link: "%s",
+        id: %s,
+        title: %s,
+        github: %s,
+        link: %s,
         image: %s,
-        content: "%s",
+        content: %s,
         stack: [
     %s
         ]
     }'''
-        js_entry = template % (
-            entry["id"],
-            entry["title"],
-            entry["github"],
-            entry["link"],
-            entry["image"],
-            entry["content"],
-            stack_items_str
+        return template % (
+            js_string(self.id),
+            js_string(self.title),
+            js_string(self.github),
+            js_string(self.link),
+            self.image,
+            js_string(self.content),
+            ",\n".join(stack_items)
         )
-        js_entries.append(js_entry)
 
-    js_code = "export const projects = [\n" + ",\n".join(js_entries) + "\n];\n"
 
+def write_projects_js(project_entries, out, cache=None):
+    """Write the `projects` export to out"""
+    write_js_array(out, "projects", project_entries, ProjectEntry.to_js, cache)
 
-    # Check if output file exists and contains relevant section
-    try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if projects is already defined
-            if "export const projects" in content:
-                # Replace existing projects
-                pattern = r"export const projects = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append projects to the end
-                content += "\n\n" + js_code
-        else:
-            # Create new file with projects
-            content = js_code
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+def volunteering_entries_from_rows(rows, stable_ids=False):
+    """Build the `extraCurricular` entries from Volunteering.csv rows.
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"Successfully updated {output_file} with projects data.")
-        return project_entries
+    IDs are row numbers, or with stable_ids=True strings derived from the
+    content of the entry.
+    """
+    volunteering_entries = []
+    seen = {}
+    for i, row in enumerate(rows):
+        # Extract data
+        company_name = row.get("Company Name", "").strip()
+        role = row.get("Role", "").strip()
+        started_on = row.get("Started On", "").strip()
+        finished_on = row.get("Finished On", "").strip()
+        description = row.get("Description", "").strip()
+
+        # Format duration
+        duration = ""
+        if started_on and finished_on:
+            duration = f"{started_on} - {finished_on}"
+        elif started_on:
+            duration = f"{started_on} - Present"
+
+        # Split description into sentences to create content items
+        content_items = [ContentItem(sentence) for sentence in split_sentences(description)]
+
+        # If no content items were created, add an empty one
+        if not content_items:
+            content_items.append(ContentItem(""))
+
+        # Create entry
+        entry = VolunteeringEntry(
+            content_id("v", (company_name, role, started_on, finished_on, description),
+                       seen) if stable_ids else i + 1,
+            company_name,
+            role,
+            duration,
+            content_items,
+        )
 
-    except Exception as e:
-        print(f"Error updating JS file: {e}")
-        return False
+        volunteering_entries.append(entry)
 
+    return volunteering_entries
 
-def convert_volunteering_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
 
-    input_file = os.path.join(input_dir, "Volunteering.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
+class VolunteeringEntry(Record):
+    """An `extraCurricular` entry"""
 
-    # Read volunteering data from CSV
-    volunteering_entries = []
-    try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for i, row in enumerate(reader):
-                # Extract data
-                company_name = row.get("Company Name", "").strip()
-                role = row.get("Role", "").strip()
-                started_on = row.get("Started On", "").strip()
-                finished_on = row.get("Finished On", "").strip()
-                description = row.get("Description", "").strip()
-
-                # Format duration
-                duration = ""
-                if started_on and finished_on:
-                    duration = f"{started_on} - {finished_on}"
-                elif started_on:
-                    duration = f"{started_on} - Present"
-
-                # Split description by periods to create content items
-                content_items = []
-                if description:
-                    # Split by period but keep the period in the text
-                    sentences = [
-                        s.strip() + "." for s in description.split(".") if s.strip()
-                    ]
-                    # Remove the last period if the original text didn't end with a period
-                    if not description.endswith(".") and sentences:
-                        sentences[-1] = sentences[-1][:-1]
-
-                    for sentence in sentences:
-                        if sentence.strip():
-                            content_items.append({"text": sentence.strip(), "link": ""})
-
-                # If no content items were created, add an empty one
-                if not content_items:
-                    content_items.append({"text": "", "link": ""})
-
-                # Create entry
-                entry = {
-                    "id": i + 1,
-                    "organisation": company_name,
-                    "title": role,
-                    "duration": duration,
-                    "content": content_items,
-                    "logo": "placeholder",
-                }
-
-                volunteering_entries.append(entry)
+    __slots__ = ("id", "organisation", "title", "duration", "content")
+    FIELDS = ("id", "organisation", "title", "duration", "content", "logo")
+    RECORD_LISTS = ("content",)
+    logo = "placeholder"
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
+    def __init__(self, id, organisation, title, duration, content):
+        self.id = id
+        self.organisation = organisation
+        self.title = title
+        self.duration = duration
+        self.content = content
 
-    # Generate JS code for extraCurricular list
-    js_entries = []
-    for entry in volunteering_entries:
+    def to_js(self):
+        """Render the entry as JS"""
         # Format content items
         content_items = []
-        for content in entry["content"]:
+        for content in self.content:
             template = '''      {
-        text: "%s",
-        link: "%s"
+        text: %s,
+        link: %s
       }'''
-            content_item = template % (content["text"], content["link"])
+            content_item = template % (js_string(content.text), js_string(content.link))
             content_items.append(content_item)
 
         template = '''  {
     id: %s,
-    organisation: "%s",
-    title: "%s",
-    duration: "%s",
+    organisation: %s,
+    title: %s,
+    duration: %s,
     content: [
 %s
     ],
     logo: %s
   }'''
-        js_entry = template % (
-            entry["id"],
-            entry["organisation"],
-            entry["title"],
-            entry["duration"],
+        return template % (
+            self.id if isinstance(self.id, int) else js_string(self.id),
+            js_string(self.organisation),
+            js_string(self.title),
+            js_string(self.duration),
             ",\n".join(content_items),
-            entry["logo"]
+            self.logo
         )
-        js_entries.append(js_entry)
 
-    js_code = "export const extraCurricular = [\n" + ",\n".join(js_entries) + "\n];\n"
 
-    # Check if output file exists and contains relevant section
-    try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if extraCurricular is already defined
-            if "export const extraCurricular" in content:
-                # Replace existing extraCurricular
-                pattern = r"export const extraCurricular = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append extraCurricular to the end
-                content += "\n\n" + js_code
-        else:
-            # Create new file with extraCurricular
-            content = js_code
+def write_volunteering_js(volunteering_entries, out, cache=None):
+    """Write the `extraCurricular` export to out"""
+    write_js_array(out, "extraCurricular", volunteering_entries, VolunteeringEntry.to_js, cache)
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+def honors_entries_from_rows(rows, stable_ids=False):
+    """Build the `achievements` entries from Honors.csv rows.
 
-        print(f"Successfully updated {output_file} with volunteering data.")
-        return volunteering_entries
+    With stable_ids=True entry IDs are derived from their content rather than
+    their row number.
+    """
+    honors_entries = []
+    seen = {}
+    for i, row in enumerate(rows):
+        # Extract data
+        title = row.get("Title", "").strip()
+        description = row.get("Description", "").strip()
+        issued_on = row.get("Issued On", "").strip()
+
+        # Split description into sentences for content fields
+        sentences = split_sentences(description)
+
+        # First 2 sentences go to content1 and content2
+        content1 = sentences[0] if len(sentences) > 0 else ""
+        content2 = sentences[1] if len(sentences) > 1 else ""
+        # All remaining sentences go to content3
+        content3 = " ".join(sentences[2:])
+
+        # Create entry
+        entry = HonorsEntry(
+            content_id("a", (title, description, issued_on), seen) if stable_ids else f"a-{i + 1}",
+            title,
+            issued_on,
+            content1,
+            content2,
+            content3,
+        )
 
-    except Exception as e:
-        print(f"Error updating JS file: {e}")
-        return False
+        honors_entries.append(entry)
 
+    return honors_entries
 
-def convert_honors_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
 
-    input_file = os.path.join(input_dir, "Honors.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
+class HonorsEntry(Record):
+    """An `achievements` entry"""
 
-    # Read honors data from CSV
-    honors_entries = []
-    try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for i, row in enumerate(reader):
-                # Extract data
-                title = row.get("Title", "").strip()
-                description = row.get("Description", "").strip()
-                issued_on = row.get("Issued On", "").strip()
-
-                # Split description by periods for content fields
-                if description:
-                    # Split by period but keep the period in the text
-                    sentences = [
-                        s.strip() + "." for s in description.split(".") if s.strip()
-                    ]
-                    # Remove the last period if the original text didn't end with a period
-                    if not description.endswith(".") and sentences:
-                        sentences[-1] = sentences[-1][:-1]
-
-                    # First 2 sentences go to content1 and content2
-                    content1 = sentences[0] if len(sentences) > 0 else ""
-                    content2 = sentences[1] if len(sentences) > 1 else ""
-                    # All remaining sentences go to content3
-                    content3 = ""
-                    if len(sentences) > 2:
-                        content3 = " ".join(sentences[2:])
-                else:
-                    content1 = ""
-                    content2 = ""
-                    content3 = ""
-
-                # Create entry
-                entry = {
-                    "id": f"a-{i + 1}",
-                    "icon": "FaRegImage",
-                    "event": title,
-                    "position": issued_on,
-                    "content1": content1,
-                    "content2": content2,
-                    "content3": content3,
-                    "article": "",
-                    "project": "",
-                    "youtube": "",
-                    "github": "",
-                }
-
-                honors_entries.append(entry)
+    __slots__ = ("id", "event", "position", "content1", "content2", "content3")
+    FIELDS = ("id", "icon", "event", "position", "content1", "content2", "content3",
+              "article", "project", "youtube", "github")
+    icon = "FaRegImage"
+    article = ""
+    project = ""
+    youtube = ""
+    github = ""
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
+    def __init__(self, id, event, position, content1, content2, content3):
+        self.id = id
+        self.event = event
+        self.position = position
+        self.content1 = content1
+        self.content2 = content2
+        self.content3 = content3
 
-    # Generate JS code for achievements list
-    js_entries = []
-    for entry in honors_entries:
+    def to_js(self):
+        """Render the entry as JS"""
         template = '''  {
-    id: "%s",
+    id: %s,
     icon: %s,
-    event: "%s",
-    position: "%s",
-    content1: "%s",
-    content2: "%s",
-    content3: "%s",
-    article: "%s",
-    project: "%s",
-    youtube: "%s",
-    github: "%s"
+    event: %s,
+    position: %s,
+    content1: %s,
+    content2: %s,
+    content3: %s,
+    article: %s,
+    project: %s,
+    youtube: %s,
+    github: %s
   }'''
-        js_entry = template % (
-            entry["id"],
-            entry["icon"],
-            entry["event"],
-            entry["position"],
-            entry["content1"],
-            entry["content2"],
-            entry["content3"],
-            entry["article"],
-            entry["project"],
-            entry["youtube"],
-            entry["github"]
+        return template % (
+            js_string(self.id),
+            self.icon,
+            js_string(self.event),
+            js_string(self.position),
+            js_string(self.content1),
+            js_string(self.content2),
+            js_string(self.content3),
+            js_string(self.article),
+            js_string(self.project),
+            js_string(self.youtube),
+            js_string(self.github)
         )
-        js_entries.append(js_entry)
 
-    js_code = "export const achievements = [\n" + ",\n".join(js_entries) + "\n];\n"
 
-    # Check if output file exists and contains relevant section
-    try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if achievements is already defined
-            if "export const achievements" in content:
-                # Replace existing achievements
-                pattern = r"export const achievements = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append achievements to the end
-                content += "\n\n" + js_code
-        else:
-            # Create new file with achievements
-            content = js_code
+def write_honors_js(honors_entries, out, cache=None):
+    """Write the `achievements` export to out"""
+    write_js_array(out, "achievements", honors_entries, HonorsEntry.to_js, cache)
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+# Rows of Positions.csv held in memory before the group-by spills to disk
+POSITIONS_MEMORY_BUDGET = 50000
 
-        print(f"Successfully updated {output_file} with honors data.")
-        return honors_entries
 
-    except Exception as e:
-        print(f"Error updating JS file: {e}")
-        return False
+# Positions.csv fields, in the order of the tuples of iter_position_rows
+POSITION_FIELDS = ("Company Name", "Title", "Started On", "Finished On", "Description")
 
 
-def convert_positions_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
+def iter_position_rows(rows):
+    """Return an iterator of (company, title, started_on, finished_on, description) per CSV row.
+
+    A RowTable is read column by column, without a dict per row.
+    """
+    if isinstance(rows, RowTable):
+        return zip(*(map(str.strip, rows.column(field)) for field in POSITION_FIELDS))
+    return (
+        tuple((row.get(field) or "").strip() for field in POSITION_FIELDS)
+        for row in rows
+    )
+
+
+def _write_spill_run(buffer):
+    """Write buffered positions to a temp file sorted by (company, sequence)"""
+    run = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    for company_index in sorted(buffer):
+        for record in buffer[company_index]:
+            run.write(json.dumps([company_index] + list(record)) + "\n")
+    run.seek(0)
+    return run
+
+
+def _read_spill_run(run):
+    for line in run:
+        yield json.loads(line)
 
-    input_file = os.path.join(input_dir, "Positions.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
 
-    # Read positions data from CSV
-    positions_data = []
+def group_positions_by_company(positions, max_rows_in_memory=POSITIONS_MEMORY_BUDGET):
+    """Group position tuples by company in order of first appearance.
+
+    Yields (company_name, positions) pairs, where positions keep their input
+    order. Only the company names and at most `max_rows_in_memory` rows are
+    held in memory; beyond that, sorted runs are spilled to temp files and
+    merged back one company at a time.
+    """
+    company_indexes = {}
+    buffer = {}
+    buffered = 0
+    runs = []
+
     try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                positions_data.append(row)
+        for sequence, position in enumerate(positions):
+            company_index = company_indexes.setdefault(position[0], len(company_indexes))
+            buffer.setdefault(company_index, []).append((sequence,) + tuple(position[1:]))
+            buffered += 1
+            if max_rows_in_memory and buffered >= max_rows_in_memory:
+                runs.append(_write_spill_run(buffer))
+                buffer = {}
+                buffered = 0
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
+        company_names = list(company_indexes)
+        if not runs:
+            # Everything fits in memory
+            for company_index, records in buffer.items():
+                yield company_names[company_index], [record[1:] for record in records]
+            return
 
-    # Group positions by organization
-    organizations = {}
-    for position in positions_data:
-        company_name = position.get("Company Name", "").strip()
-
-        if company_name not in organizations:
-            organizations[company_name] = []
-
-        organizations[company_name].append(position)
-
-    # Process each organization and its positions
-    experience_entries = []
-    for company_name, positions in organizations.items():
-        # Create organization entry
-        org_entry = {
-            "organisation": company_name,
-            "logo": "placeholder",
-            "link": "",
-            "positions": [],
-        }
+        if buffer:
+            runs.append(_write_spill_run(buffer))
+            buffer = {}
 
-        # Sort positions by date (most recent first)
-        def get_position_date(position):
-            started_on = parse_date(position.get("Started On", "").strip())
-            finished_on = parse_date(position.get("Finished On", "").strip())
-            # If no end date, use a far future date to sort "Present" positions first
-            if not finished_on:
-                finished_on = datetime(9999, 12, 31)
-            return (started_on, finished_on) if started_on else (datetime.min, datetime.min)
-
-        positions.sort(key=get_position_date, reverse=True)
-
-        # Process each position for this organization
-        for position in positions:
-            title = position.get("Title", "").strip()
-            started_on = position.get("Started On", "").strip()
-            finished_on = position.get("Finished On", "").strip()
-            description = position.get("Description", "").strip()
-
-            # Format duration
-            duration = ""
-            if started_on and finished_on:
-                duration = f"{format_date(started_on)} - {format_date(finished_on)}"
-            elif started_on:
-                duration = f"{format_date(started_on)} - Present"
-
-            # Split description into content items
-            content_items = []
+        # Merge the sorted runs and emit each company once all its rows are read
+        merged = heapq.merge(*(_read_spill_run(run) for run in runs), key=lambda record: record[:2])
+        for company_index, records in groupby(merged, key=lambda record: record[0]):
+            yield company_names[company_index], [tuple(record[2:]) for record in records]
 
-            # Check if description contains bullet points
-            if "•" in description:
-                # Split by bullet points
-                bullet_items = [
-                    item.strip() for item in description.split("•") if item.strip()
-                ]
-                for item in bullet_items:
-                    content_items.append({"text": item, "link": ""})
-            else:
-                # Split by periods
-                sentences = [
-                    s.strip() + "." for s in description.split(".") if s.strip()
-                ]
-                # Remove the last period if the original text didn't end with a period
-                if not description.endswith(".") and sentences:
-                    sentences[-1] = sentences[-1][:-1]
-
-                for sentence in sentences:
-                    if sentence.strip():
-                        content_items.append({"text": sentence.strip(), "link": ""})
-
-            # If no content items were created, add a default one with the description
-            if not content_items and description:
-                content_items.append({"text": description, "link": ""})
-            elif not content_items:
-                content_items.append({"text": "", "link": ""})
-
-            # Create position entry
-            position_entry = {
-                "title": title,
-                "duration": duration,
-                "content": content_items,
-            }
+    finally:
+        for run in runs:
+            run.close()
+
+
+def get_position_date(position):
+    """Sort key for a (title, started_on, finished_on, description) position"""
+    return date_sort_key(position[1], position[2])
+
+
+def build_experience_entry(company_name, positions):
+    """Build the experiences entry of one organization from its positions"""
+    # Create organization entry
+    org_entry = ExperienceEntry(company_name, [])
+
+    # Sort positions by date (most recent first)
+    positions.sort(key=get_position_date, reverse=True)
+
+    # Process each position for this organization
+    for title, started_on, finished_on, description in positions:
+        # Format duration
+        duration = ""
+        if started_on and finished_on:
+            duration = f"{format_date(started_on)} - {format_date(finished_on)}"
+        elif started_on:
+            duration = f"{format_date(started_on)} - Present"
+
+        # Split description into bullet points, or sentences if there are none
+        content_items = [ContentItem(item) for item in split_description(description, bullets=True)]
+
+        # If no content items were created, add a default one with the description
+        if not content_items and description:
+            content_items.append(ContentItem(description))
+        elif not content_items:
+            content_items.append(ContentItem(""))
+
+        # Create position entry
+        org_entry.positions.append(PositionEntry(title, duration, content_items))
+
+    return org_entry
+
+
+class PositionEntry(Record):
+    """A position held at an organization of `experiences`"""
 
-            org_entry["positions"].append(position_entry)
+    __slots__ = ("title", "duration", "content")
+    FIELDS = ("title", "duration", "content")
+    RECORD_LISTS = ("content",)
 
-        experience_entries.append(org_entry)
+    def __init__(self, title, duration, content):
+        self.title = title
+        self.duration = duration
+        self.content = content
 
-    # Generate JS code for experiences list
-    js_entries = []
-    for entry in experience_entries:
+
+class ExperienceEntry(Record):
+    """An `experiences` entry: an organization and the positions held there"""
+
+    __slots__ = ("organisation", "positions")
+    FIELDS = ("organisation", "logo", "link", "positions")
+    RECORD_LISTS = ("positions",)
+    logo = "placeholder"
+    link = ""
+
+    def __init__(self, organisation, positions):
+        self.organisation = organisation
+        self.positions = positions
+
+    def to_js(self):
+        """Render the entry as JS"""
         # Format positions
         positions_items = []
-        for position in entry["positions"]:
+        for position in self.positions:
             # Format content items
             content_items = []
-            for content in position["content"]:
+            for content in position.content:
                 content_template = '''          {
-            text: "%s",
-            link: "%s"
+            text: %s,
+            link: %s
           }'''
                 content_item = content_template % (
-                    content["text"],
-                    content["link"]
+                    js_string(content.text),
+                    js_string(content.link)
                 )
                 content_items.append(content_item)
 
             position_template = '''      {
-        title: "%s",
-        duration: "%s",
+        title: %s,
+        duration: %s,
         content: [
 %s
         ]
       }'''
             position_item = position_template % (
-                position["title"],
-                position["duration"],
+                js_string(position.title),
+                js_string(position.duration),
                 ",\n".join(content_items)
             )
             positions_items.append(position_item)
 
         template = '''  {
-    organisation: "%s",
+    organisation: %s,
     logo: %s,
-    link: "%s",
+    link: %s,
     positions: [
 %s
     ]
   }'''
-        js_entry = template % (
-            entry["organisation"],
-            entry["logo"],
-            entry["link"],
+        return template % (
+            js_string(self.organisation),
+            self.logo,
+            js_string(self.link),
             ",\n".join(positions_items)
         )
-        js_entries.append(js_entry)
 
-    js_code = "export const experiences = [\n" + ",\n".join(js_entries) + "\n];\n"
-
-    # Check if output file exists and contains relevant section
-    try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if experiences is already defined
-            if "export const experiences" in content:
-                # Replace existing experiences
-                pattern = r"export const experiences = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append experiences to the end
-                content += "\n\n" + js_code
-        else:
-            # Create new file with experiences
-            content = js_code
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+def experience_entries_from_rows(rows, max_rows_in_memory=POSITIONS_MEMORY_BUDGET):
+    """Build the `experiences` entries from Positions.csv rows.
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+    Rows are streamed and grouped by company with a bounded memory budget;
+    each organization is built as soon as all of its positions are known.
+    """
+    groups = group_positions_by_company(iter_position_rows(rows), max_rows_in_memory)
+    return [build_experience_entry(company_name, positions) for company_name, positions in groups]
 
-        print(f"Successfully updated {output_file} with positions data.")
-        return experience_entries
 
-    except Exception as e:
-        print(f"Error updating JS file: {e}")
-        return False
+def write_experiences_js(experience_entries, out):
+    """Write the `experiences` export to out"""
+    write_js_array(out, "experiences", experience_entries, ExperienceEntry.to_js)
 
 
-def convert_profile_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
-
-    input_file = os.path.join(input_dir, "Profile.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
-
+def profile_from_rows(rows):
+    """Build the `aboutMe` data from the first Profile.csv row"""
     # Default values
     name = ""
     githubUsername = ""
     tagLine = ""
     intro = "This is a placeholder intro"
 
-    # Read profile data from CSV
-    try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Only process the first row
-                first_name = row.get("First Name", "").strip()
-                last_name = row.get("Last Name", "").strip()
-                headline = row.get("Headline", "").strip()
-
-                # Format full name
-                name = f"{first_name} {last_name}".strip()
-
-                # Use headline as tagLine
-                tagLine = headline
-
-                # Only process the first row
-                break
+    for row in rows:
+        # Only process the first row
+        first_name = row.get("First Name", "").strip()
+        last_name = row.get("Last Name", "").strip()
+        headline = row.get("Headline", "").strip()
+
+        # Format full name
+        name = f"{first_name} {last_name}".strip()
+
+        # Use headline as tagLine
+        tagLine = headline
+
+        # Only process the first row
+        break
+
+    return Profile(name, githubUsername, tagLine, intro)
+
+
+class Profile(Record):
+    """The `aboutMe` data"""
+
+    __slots__ = ("name", "githubUsername", "tagLine", "intro")
+    FIELDS = ("name", "githubUsername", "tagLine", "intro")
+
+    def __init__(self, name, githubUsername, tagLine, intro):
+        self.name = name
+        self.githubUsername = githubUsername
+        self.tagLine = tagLine
+        self.intro = intro
+
+    def to_js(self):
+        """Render the profile as a JS object"""
+        template = '''{
+    name: %s,
+    githubUsername: %s,
+    tagLine: %s,
+    intro: %s
+}'''
+        return template % (
+            js_string(self.name),
+            js_string(self.githubUsername),
+            js_string(self.tagLine),
+            js_string(self.intro)
+        )
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
 
-    # Generate JS code for aboutMe object
-    template = '''export const aboutMe = {
-    name: "%s",
-    githubUsername: "%s",
-    tagLine: "%s",
-    intro: "%s"
-};'''
-    js_code = template % (
-        name,
-        githubUsername,
-        tagLine,
-        intro
+def write_profile_js(profile_data, out):
+    """Write the `aboutMe` export to out"""
+    out.write(f"export const aboutMe = {profile_data.to_js()};")
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercase keywords.
+
+    Each keyword carries a priority; search() returns the lowest priority of
+    any keyword occurring in the text, scanning the text once regardless of
+    how many keywords there are.
+    """
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [None]
+
+        # Build the keyword trie
+        for keyword, priority in keywords:
+            state = 0
+            for char in keyword:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(None)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            if self.output[state] is None or priority < self.output[state]:
+                self.output[state] = priority
+
+        # Add failure links breadth-first, merging outputs along them
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                inherited = self.output[self.fail[child]]
+                if inherited is not None and (self.output[child] is None or inherited < self.output[child]):
+                    self.output[child] = inherited
+
+    def search(self, text):
+        """Return the lowest priority of the keywords found in text, or None"""
+        goto, fail, output = self.goto, self.fail, self.output
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = output[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+
+SkillTaxonomy = namedtuple("SkillTaxonomy", ["categories", "default_category", "automaton"])
+
+# Icon name generators referenced by the "icon" field of taxonomy categories
+SKILL_ICON_STYLES = {
+    "simple-icons": lambda skill_name: f"Si{skill_name.replace(' ', '').capitalize()}",
+    "placeholder": lambda skill_name: "FaRegImage",
+}
+
+
+@lru_cache(maxsize=16)
+def _compile_skill_taxonomy(taxonomy_file, modified_ns):
+    with open(taxonomy_file, "r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+
+    categories = taxonomy.get("categories", [])
+    default_category = taxonomy["default_category"]
+    for category in categories + [default_category]:
+        if category.get("icon") not in SKILL_ICON_STYLES:
+            raise ValueError(f"Unknown icon style {category.get('icon')!r} in {taxonomy_file}")
+
+    # Earlier categories win when a skill matches keywords of several
+    automaton = KeywordAutomaton(
+        (keyword.lower(), priority)
+        for priority, category in enumerate(categories)
+        for keyword in category.get("keywords", [])
     )
+    return SkillTaxonomy(categories, default_category, automaton)
 
-    # Check if output file exists and contains relevant section
-    try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if aboutMe is already defined
-            if "export const aboutMe" in content:
-                # Replace existing aboutMe
-                pattern = r"export const aboutMe = \{[\s\S]*?\};"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append aboutMe to the end
-                content += "\n\n" + js_code
-        else:
-            # Create new file with aboutMe
-            content = js_code
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+def load_skill_taxonomy(taxonomy_file=None):
+    """Load and compile a skill taxonomy, reusing it until the file changes"""
+    if taxonomy_file is None:
+        taxonomy_file = get_default_paths()['skill_taxonomy']
+    taxonomy_file = os.path.abspath(taxonomy_file)
+    return _compile_skill_taxonomy(taxonomy_file, os.stat(taxonomy_file).st_mtime_ns)
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
 
-        print(f"Successfully updated {output_file} with profile data.")
-        return {
-            "name": name,
-            "githubUsername": githubUsername,
-            "tagLine": tagLine,
-            "intro": intro
-        }
+def skill_categories_from_rows(rows, taxonomy_file=None, stable_ids=False):
+    """Build the `skills` categories from Skills.csv rows.
 
-    except Exception as e:
-        print(f"Error updating JS file: {e}")
-        return False
+    Skills marked "(Programming Language)" are languages; the rest are
+    classified by the keyword categories of the skill taxonomy, falling back
+    to its default category. With stable_ids=True item IDs are derived from
+    the skill name rather than its position in the category. `rows` may be
+    a RowTable, whose Name column is read directly.
+    """
+    taxonomy = load_skill_taxonomy(taxonomy_file)
+    if isinstance(rows, RowTable):
+        names = rows.column("Name")
+    else:
+        names = (row.get("Name") or "" for row in rows)
 
+    # Initialize categories, keeping the default category last
+    programming_languages = []
+    keyword_categories = taxonomy.categories + [taxonomy.default_category]
+    category_items = [[] for _ in keyword_categories]
+    default_index = len(keyword_categories) - 1
+    pl_count = 1  # Counter for programming languages
+    seen = {}
+
+    for skill_name in map(str.strip, names):
+        if not skill_name:
+            continue
+
+        # Check if it's a programming language
+        if "(Programming Language)" in skill_name:
+            # Extract the language name without the "(Programming Language)" part
+            language_name = skill_name.replace("(Programming Language)", "").strip()
+            # Generate icon name based on language
+            icon_name = f"Si{language_name.replace(' ', '')}"
+
+            programming_languages.append(SkillItem(
+                content_id("pl", (language_name,), seen) if stable_ids else f"pl-{pl_count}",
+                icon_name,
+                language_name
+            ))
+            pl_count += 1
+            continue
+
+        # Match taxonomy keywords, everything else goes to the default category
+        index = taxonomy.automaton.search(skill_name.lower())
+        if index is None:
+            index = default_index
+        category = keyword_categories[index]
+        items = category_items[index]
+        if stable_ids:
+            item_id = content_id(category["id_prefix"], (skill_name,), seen)
+        else:
+            item_id = f"{category['id_prefix']}-{len(items) + 1}"
+        items.append(SkillItem(item_id, SKILL_ICON_STYLES[category["icon"]](skill_name), skill_name))
 
-def convert_skills_csv_to_js(input_dir=None, output_file=None):
-    # Define paths
-    if input_dir is None or output_file is None:
-        paths = get_default_paths()
-        input_dir = input_dir or paths['input_dir']
-        output_file = output_file or paths['output']
+    # Generate skills categories, skipping empty ones
+    categories = []
+    if programming_languages:
+        categories.append(SkillCategory("Programming Languages", programming_languages))
 
-    input_file = os.path.join(input_dir, "Skills.csv")
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file {input_file} not found.")
-        return False
+    for category, items in zip(keyword_categories, category_items):
+        if items:
+            categories.append(SkillCategory(category["title"], items))
 
-    common_frameworks = ["flask", "django", "react", "angular", "vue", "laravel", "spring", "bootstrap", "tailwind css", "tailwindcss", "express", "dotnet", "tensorflow", "pytorch", "rubyonrails", "rails", "bootstrap", "jquery", "nodejs", "nextjs", "nuxtjs", "angularjs", "vuejs"]
+    return categories
 
-    # Initialize categories
-    programming_languages = []
-    frameworks = []
-    tools = []
 
-    # Read skills data from CSV
-    try:
-        with open(input_file, "r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            pl_count = 1  # Counter for programming languages
-            f_count = 1   # Counter for frameworks
-            t_count = 1   # Counter for tools
+class SkillItem(Record):
+    """A skill of a `skills` category"""
 
-            for row in reader:
-                skill_name = row.get("Name", "").strip()
+    __slots__ = ("id", "icon", "name")
+    FIELDS = ("id", "icon", "name")
 
-                if not skill_name:
-                    continue
+    def __init__(self, id, icon, name):
+        self.id = id
+        self.icon = icon
+        self.name = name
 
-                # Check if it's a programming language
-                if "(Programming Language)" in skill_name:
-                    # Extract the language name without the "(Programming Language)" part
-                    language_name = skill_name.replace("(Programming Language)", "").strip()
-                    # Generate icon name based on language
-                    icon_name = f"Si{language_name.replace(' ', '')}"
-
-                    programming_languages.append({
-                        "id": f"pl-{pl_count}",
-                        "icon": icon_name,
-                        "name": language_name
-                    })
-                    pl_count += 1
-
-                # Check for common frameworks keywords
-                elif any(keyword in skill_name.lower() for keyword in common_frameworks):
-                    # Use FaRegImage as a placeholder for framework icons
-                    frameworks.append({
-                        "id": f"f-{f_count}",
-                        "icon": f"Si{skill_name.replace(' ', '').capitalize()}",
-                        "name": skill_name
-                    })
-                    f_count += 1
-
-                # Everything else goes to tools
-                else:
-                    tools.append({
-                        "id": f"t-{t_count}",
-                        "icon": "FaRegImage",
-                        "name": skill_name
-                    })
-                    t_count += 1
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return False
+class SkillCategory(Record):
+    """A `skills` category and its skills"""
 
-    # Generate skills categories
-    categories = []
+    __slots__ = ("title", "items")
+    FIELDS = ("title", "items")
+    RECORD_LISTS = ("items",)
 
-    # Add programming languages category if not empty
-    if programming_languages:
-        categories.append({
-            "title": "Programming Languages",
-            "items": programming_languages
-        })
-
-    # Add frameworks category if not empty
-    if frameworks:
-        categories.append({
-            "title": "Frameworks/Libraries",
-            "items": frameworks
-        })
-
-    # Add tools category if not empty
-    if tools:
-        categories.append({
-            "title": "Tools",
-            "items": tools
-        })
-
-    # Generate JS code for skills list
-    js_entries = []
-    for category in categories:
+    def __init__(self, title, items):
+        self.title = title
+        self.items = items
+
+    def to_js(self):
+        """Render the category as JS"""
         # Format items
         items_entries = []
-        for item in category["items"]:
+        for item in self.items:
             item_template = '''      {
-        id: "%s",
+        id: %s,
         icon: %s,
-        name: "%s"
+        name: %s
       }'''
             item_entry = item_template % (
-                item["id"],
-                item["icon"],
-                item["name"]
+                js_string(item.id),
+                item.icon,
+                js_string(item.name)
             )
             items_entries.append(item_entry)
 
         template = '''  {
-    title: "%s",
+    title: %s,
     items: [
 %s
     ]
   }'''
-        js_entry = template % (
-            category["title"],
+        return template % (
+            js_string(self.title),
             ",\n".join(items_entries)
         )
-        js_entries.append(js_entry)
 
-    js_code = "export const skills = [\n" + ",\n".join(js_entries) + "\n];\n"
 
-    # Check if output file exists and contains relevant section
+def write_skills_js(categories, out):
+    """Write the `skills` export to out"""
+    write_js_array(out, "skills", categories, SkillCategory.to_js)
+
+
+class TimedRows:
+    """Iterator over CSV rows that accumulates the time spent parsing them"""
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = next(self.rows)
+        finally:
+            self.seconds += time.perf_counter() - start
+        self.count += 1
+        return row
+
+
+# Row tables cached by --row-cache start with this magic, then the length of a
+# JSON header, the distinct strings joined by NUL and one uint32 string index
+# per field, column by column
+ROW_TABLE_MAGIC = b"LIROWS1\n"
+
+
+class RowTable:
+    """CSV rows stored column by column, with every distinct string kept once.
+
+    `columns` holds one sequence of indexes into `strings` per field; they may
+    be views of a memory-mapped cache file. The transforms of
+    COLUMNAR_SECTIONS read fields with column(); rows() rebuilds
+    DictReader-style dicts entirely in C for the others.
+    """
+
+    def __init__(self, fieldnames, strings, columns):
+        self.fieldnames = fieldnames
+        self.strings = strings
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def column(self, field):
+        """Iterate over the values of a field, or "" per row if there is no such field"""
+        # Like DictReader, a repeated field name refers to its last column
+        positions = {name: i for i, name in enumerate(self.fieldnames)}
+        if field not in positions:
+            return repeat("", len(self))
+        return map(self.strings.__getitem__, self.columns[positions[field]])
+
+    def rows(self):
+        """Iterate over the rows as {field: value} dicts"""
+        values = zip(*(map(self.strings.__getitem__, column) for column in self.columns))
+        return map(dict, map(zip, repeat(self.fieldnames), values))
+
+
+def parse_row_table(csvfile):
+    """Parse a CSV into a RowTable.
+
+    Returns None for the CSVs a table cannot represent exactly: rows with
+    more or fewer fields than the header, or values containing NUL.
+    """
+    reader = csv.reader(csvfile)
+    fieldnames = next(reader, [])
+    # Like DictReader, skip blank lines
+    records = [record for record in reader if record]
+    if any(len(record) != len(fieldnames) for record in records):
+        return None
+
+    values = list(zip(*records)) if records else [() for _ in fieldnames]
+    strings = list(dict.fromkeys(value for column in values for value in column))
+    if any("\x00" in string for string in strings):
+        return None
+    position = {string: i for i, string in enumerate(strings)}
+    columns = [array.array("I", map(position.__getitem__, column)) for column in values]
+    return RowTable(fieldnames, strings, columns)
+
+
+def save_row_table(table, path):
+    """Write a RowTable in the binary layout read by load_row_table"""
+    blob = "\x00".join(table.strings).encode("utf-8")
+    header = json.dumps({
+        "fieldnames": table.fieldnames,
+        "rows": len(table),
+        "strings": len(table.strings),
+        "blob_bytes": len(blob),
+        "byteorder": sys.byteorder,
+    }).encode("utf-8")
+    # Align the index columns so they can be cast in place
+    prefix = len(ROW_TABLE_MAGIC) + 4 + len(header) + len(blob)
+    padding = b"\x00" * (-prefix % 4)
+    write_file_atomic(path, b"".join(
+        [ROW_TABLE_MAGIC, len(header).to_bytes(4, "little"), header, blob, padding]
+        + [column.tobytes() for column in table.columns]
+    ))
+
+
+def load_row_table(path):
+    """Memory-map a RowTable written by save_row_table, or return None if unusable"""
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
     try:
-        content = ""
-        if os.path.exists(output_file):
-            with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if skills is already defined
-            if "export const skills" in content:
-                # Replace existing skills
-                pattern = r"export const skills = \[[\s\S]*?\];"
-                content = re.sub(pattern, js_code.strip(), content)
-            else:
-                # Append skills to the end
-                content += "\n\n" + js_code
+        if data[:len(ROW_TABLE_MAGIC)] != ROW_TABLE_MAGIC:
+            return None
+        position = len(ROW_TABLE_MAGIC)
+        header_size = int.from_bytes(data[position:position + 4], "little")
+        position += 4
+        header = json.loads(data[position:position + header_size])
+        if header["byteorder"] != sys.byteorder:
+            return None
+        position += header_size
+
+        blob = data[position:position + header["blob_bytes"]].decode("utf-8")
+        strings = blob.split("\x00") if header["strings"] else []
+        position += header["blob_bytes"]
+        position += -position % 4
+
+        rows = header["rows"]
+        view = memoryview(data)
+        columns = []
+        for _ in header["fieldnames"]:
+            columns.append(view[position:position + rows * 4].cast("I"))
+            position += rows * 4
+        if len(strings) != header["strings"] or position != len(data):
+            return None
+        return RowTable(header["fieldnames"], strings, columns)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def export_file_stamp(input_dir, filename):
+    """Identify the content of a CSV of the export without reading it.
+
+    A file is identified by its path, size and modification time; a ZIP
+    member by the archive path, its name, size and the CRC stored in the
+    archive. Returns None if the CSV is missing.
+    """
+    if is_export_archive(input_dir):
+        with zipfile.ZipFile(input_dir) as archive:
+            member = find_export_member(archive, filename)
+            if member is None:
+                return None
+            info = archive.getinfo(member)
+            fields = (os.path.abspath(input_dir), member, info.file_size, info.CRC)
+    else:
+        path = os.path.abspath(os.path.join(input_dir, filename))
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        fields = (path, stat.st_size, stat.st_mtime_ns)
+    return hash_text("\x1f".join(map(str, fields)))
+
+
+def read_row_table(input_dir, filename, cache_dir):
+    """Return the RowTable of a CSV of the export, cached in cache_dir.
+
+    Cached tables are keyed by export_file_stamp, so a warm run neither
+    reads nor hashes the CSV; the table is memory-mapped instead. Returns
+    None if the CSV cannot be represented as a table.
+    """
+    path = os.path.join(cache_dir, f"{export_file_stamp(input_dir, filename)}.rows")
+    table = load_row_table(path) if os.path.exists(path) else None
+    if table is None:
+        with open_export_file(input_dir, filename) as csvfile:
+            table = parse_row_table(csvfile)
+        if table is not None:
+            save_row_table(table, path)
+    return table
+
+
+class RunReport:
+    """Per-stage timings, row counts, byte counts and peak memory of an import.
+
+    Stages are recorded per section in the order they start. Peak memory is
+    only measured while tracemalloc is tracing. A disabled report records
+    nothing, so the builders can always be given one.
+    """
+
+    METRICS = {
+        "seconds": "Wall time spent in the stage",
+        "rows": "CSV rows handled by the stage",
+        "bytes_read": "Bytes read by the stage",
+        "bytes_written": "Bytes produced by the stage",
+        "peak_bytes": "Peak traced memory during the stage",
+    }
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = []
+
+    def record(self, section, stage, **values):
+        """Add a stage measured elsewhere and return its record"""
+        record = {"section": section, "stage": stage, "seconds": 0.0, "rows": 0,
+                  "bytes_read": 0, "bytes_written": 0, "peak_bytes": None}
+        record.update(values)
+        if self.enabled:
+            self.stages.append(record)
+        return record
+
+    @contextmanager
+    def stage(self, section, stage):
+        """Time the enclosed block; counters can be set on the yielded record"""
+        record = self.record(section, stage)
+        if not self.enabled:
+            yield record
+            return
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] += time.perf_counter() - start
+            if tracing:
+                record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+
+    def to_json(self):
+        return {"tool_version": TOOL_VERSION, "stages": self.stages}
+
+    def to_prometheus(self):
+        """Format the stages in the Prometheus textfile exposition format"""
+        lines = []
+        for metric, help_text in self.METRICS.items():
+            name = f"linkedin_import_stage_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for record in self.stages:
+                if record[metric] is None:
+                    continue
+                labels = f'section="{record["section"]}",stage="{record["stage"]}"'
+                lines.append(f"{name}{{{labels}}} {record[metric]}")
+        return "\n".join(lines) + "\n"
+
+    def format_table(self):
+        """Format the stages as a table for --profile"""
+        lines = [f"{'section':<18}{'stage':<18}{'seconds':>10}{'rows':>10}"
+                 f"{'read KiB':>11}{'written KiB':>13}{'peak MiB':>10}"]
+        for record in self.stages:
+            peak = "-" if record["peak_bytes"] is None else f"{record['peak_bytes'] / 2 ** 20:.1f}"
+            lines.append(
+                f"{record['section']:<18}{record['stage']:<18}{record['seconds']:>10.4f}"
+                f"{record['rows']:>10}{record['bytes_read'] / 1024:>11.1f}"
+                f"{record['bytes_written'] / 1024:>13.1f}{peak:>10}"
+            )
+        return "\n".join(lines)
+
+    def write(self, report_file):
+        """Write the JSON report and a Prometheus textfile next to it"""
+        write_file_atomic(report_file, json.dumps(self.to_json(), indent=4))
+        write_file_atomic(os.path.splitext(report_file)[0] + ".prom", self.to_prometheus())
+
+
+# Sections produced by the importer, in the order they are written.
+# `transform` turns CSV rows into data and `write_js` writes that data as the
+# JS export to a file handle; `json_arg` is the matching keyword argument of
+# update_json_file.
+Section = namedtuple("Section", ["name", "csv_file", "transform", "write_js", "label", "json_arg"])
+
+SECTIONS = [
+    Section("educationList", "Education.csv", education_entries_from_rows, write_education_js,
+            "education", "education_entries"),
+    Section("projects", "Projects.csv", project_entries_from_rows, write_projects_js,
+            "projects", "project_entries"),
+    Section("extraCurricular", "Volunteering.csv", volunteering_entries_from_rows, write_volunteering_js,
+            "volunteering", "volunteering_entries"),
+    Section("achievements", "Honors.csv", honors_entries_from_rows, write_honors_js,
+            "honors", "honors_entries"),
+    Section("experiences", "Positions.csv", experience_entries_from_rows, write_experiences_js,
+            "positions", "experience_entries"),
+    Section("aboutMe", "Profile.csv", profile_from_rows, write_profile_js,
+            "profile", "profile_data"),
+    Section("skills", "Skills.csv", skill_categories_from_rows, write_skills_js,
+            "skills", "skills_categories"),
+]
+
+SECTIONS_BY_NAME = {section.name: section for section in SECTIONS}
+
+# Sections rendered as one entry per ID, which a FragmentCache can reuse
+CACHED_SECTIONS = {"educationList", "projects", "extraCurricular", "achievements"}
+
+# Sections whose transform reads the columns of a RowTable instead of row dicts
+COLUMNAR_SECTIONS = {"experiences", "skills"}
+
+# Sections whose transform accepts stable_ids
+STABLE_ID_SECTIONS = ["educationList", "projects", "extraCurricular", "achievements", "skills"]
+
+
+# A converted section: its data as records, and its rendered JS export
+SectionResult = namedtuple("SectionResult", ["data", "js_code"])
+
+
+def check_fragment_cache(name, fragment_cache, stable_ids):
+    """Raise ValueError if a FragmentCache would render a section with positional IDs.
+
+    Row-number IDs name different entries from one export to the next, so
+    cached fragments would be served for the wrong content.
+    """
+    if fragment_cache is not None and name in CACHED_SECTIONS and not stable_ids:
+        raise ValueError(f"A fragment cache for {name} requires stable_ids=True")
+
+
+def iter_source_rows(source, columnar=False):
+    """Return the CSV rows of a text stream, CSV text or bytes, or an iterable of row dicts.
+
+    A RowTable is returned as it is if `columnar`, else as its rows.
+    """
+    if isinstance(source, RowTable):
+        return source if columnar else source.rows()
+    if isinstance(source, (bytes, bytearray)):
+        source = source.decode("utf-8")
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    if hasattr(source, "read"):
+        return csv.DictReader(source)
+    return source
+
+
+def convert_rows(name, source, report=None, fragment_cache=None, render=True, **options):
+    """Convert the CSV of a section held in memory, without touching the filesystem.
+
+    `source` is anything iter_source_rows accepts, including a RowTable.
+    `options` are extra keyword arguments for the section's transform.
+    Parsing rows, transforming them and rendering JS are recorded as separate
+    stages of `report`, if one is given. `fragment_cache` is the directory of a FragmentCache used to
+    render the entries; it requires stable_ids=True, or ValueError is
+    raised. With render=False the JS is left to section_js_writer and the
+    result's js_code is None.
+    Returns a SectionResult; writing it out, e.g. with write_js_sections and
+    update_json_file, is up to the caller.
+    """
+    check_fragment_cache(name, fragment_cache, options.get("stable_ids", False))
+    if report is None:
+        report = RunReport(enabled=False)
+
+    # Parsing is interleaved with the transform, so time it separately
+    parse = report.record(name, "parse")
+    with report.stage(name, "transform") as stage:
+        rows = iter_source_rows(source, name in COLUMNAR_SECTIONS)
+        if report.enabled and not isinstance(rows, RowTable):
+            rows = TimedRows(rows)
+        data = SECTIONS_BY_NAME[name].transform(rows, **options)
+    if isinstance(rows, RowTable):
+        # Columns are read as the transform goes; there is nothing to parse
+        stage["rows"] = parse["rows"] = len(rows)
+    elif report.enabled:
+        stage["seconds"] -= rows.seconds
+        stage["rows"] = parse["rows"] = rows.count
+        parse["seconds"] = rows.seconds
+        parse["peak_bytes"] = stage["peak_bytes"]
+
+    if not render:
+        return SectionResult(data, None)
+
+    with report.stage(name, "render") as stage:
+        if fragment_cache is None or name not in CACHED_SECTIONS:
+            js_code = render_section_js(name, data)
         else:
-            # Create new file with skills
-            content = js_code
+            js_code = render_section_js(name, data, FragmentCache(fragment_cache))
+        stage["bytes_written"] = len(js_code.encode("utf-8"))
+
+    return SectionResult(data, js_code)
+
+
+def section_js_writer(name, data, report=None, fragment_cache=None, stable_ids=False):
+    """Return a function that writes the export of a section to a file handle.
+
+    This lets write_js_sections render a section straight into the JS file.
+    The write is recorded as the "render" stage of `report`, if given, with
+    its time only: it runs inside the splice_write stage, whose memory peak
+    it must not reset, so that peak covers it. `fragment_cache` is as for
+    convert_rows, and `stable_ids` says whether `data` was built with
+    stable_ids=True.
+    """
+    check_fragment_cache(name, fragment_cache, stable_ids)
+    if report is None:
+        report = RunReport(enabled=False)
+
+    def write(out):
+        start = time.perf_counter()
+        if fragment_cache is None or name not in CACHED_SECTIONS:
+            write_section_js(name, data, out)
+        else:
+            write_section_js(name, data, out, FragmentCache(fragment_cache))
+        report.record(name, "render", seconds=time.perf_counter() - start)
+    return write
+
+
+def build_section(name, input_dir=None, report=None, fragment_cache=None, row_cache=None, render=True,
+                  **options):
+    """Read the CSV of a section from the export and convert it with convert_rows.
+
+    Opening the CSV is recorded as a stage of `report`, if one is given. With
+    `row_cache`, a directory, rows are read from the cached RowTable of the
+    CSV rather than parsed again. The other arguments are passed to
+    convert_rows.
+    Returns a SectionResult, or False if the CSV could not be read.
+    """
+    check_fragment_cache(name, fragment_cache, options.get("stable_ids", False))
+    if input_dir is None:
+        input_dir = get_default_paths()['input_dir']
+    if report is None:
+        report = RunReport(enabled=False)
+
+    section = SECTIONS_BY_NAME[name]
+    input_file = os.path.join(input_dir, section.csv_file)
+    # Check if input file exists
+    if not export_file_exists(input_dir, section.csv_file):
+        print(f"Error: Input file {input_file} not found.")
+        return False
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    try:
+        with ExitStack() as stack:
+            source = None
+            if row_cache is not None:
+                with report.stage(name, "row_table") as stage:
+                    source = read_row_table(input_dir, section.csv_file, row_cache)
+                    stage["rows"] = len(source) if source is not None else 0
 
-        # Write updated content to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+            # A cached table replaces the CSV, which is then not opened at all
+            if source is None:
+                with report.stage(name, "csv_open") as stage:
+                    source = stack.enter_context(open_export_file(input_dir, section.csv_file))
+                    stage["bytes_read"] = export_file_size(input_dir, section.csv_file)
 
-        print(f"Successfully updated {output_file} with skills data.")
-        return categories
+            return convert_rows(name, source, report, fragment_cache, render, **options)
 
     except Exception as e:
-        print(f"Error updating JS file: {e}")
+        print(f"Error reading CSV file: {e}")
         return False
 
 
+def write_section_js(name, data, out, cache=None):
+    """Write the export of a section built from `data` to a file handle.
+
+    `cache` is a FragmentCache for the entries of the CACHED_SECTIONS.
+    """
+    if cache is None:
+        SECTIONS_BY_NAME[name].write_js(data, out)
+    else:
+        SECTIONS_BY_NAME[name].write_js(data, out, cache)
+
+
+def render_section_js(name, data, cache=None):
+    """Return the export of a section built from `data` as a string"""
+    out = io.StringIO()
+    write_section_js(name, data, out, cache)
+    return out.getvalue()
+
+
+def build_education_section(input_dir=None):
+    """Read Education.csv and render the `educationList` export"""
+    return build_section("educationList", input_dir)
+
+
+def build_projects_section(input_dir=None):
+    """Read Projects.csv and render the `projects` export"""
+    return build_section("projects", input_dir)
+
+
+def build_volunteering_section(input_dir=None):
+    """Read Volunteering.csv and render the `extraCurricular` export"""
+    return build_section("extraCurricular", input_dir)
+
+
+def build_honors_section(input_dir=None):
+    """Read Honors.csv and render the `achievements` export"""
+    return build_section("achievements", input_dir)
+
+
+def build_positions_section(input_dir=None, max_rows_in_memory=POSITIONS_MEMORY_BUDGET):
+    """Read Positions.csv and render the `experiences` export"""
+    return build_section("experiences", input_dir, max_rows_in_memory=max_rows_in_memory)
+
+
+def build_profile_section(input_dir=None):
+    """Read Profile.csv and render the `aboutMe` export"""
+    return build_section("aboutMe", input_dir)
+
+
+def build_skills_section(input_dir=None, taxonomy_file=None):
+    """Read Skills.csv and render the `skills` export"""
+    return build_section("skills", input_dir, taxonomy_file=taxonomy_file)
+
+
+
+def convert_section(name, input_dir=None, output_file=None, report=None):
+    """Build a single section and splice it into the JS file"""
+    # Define paths
+    if input_dir is None or output_file is None:
+        paths = get_default_paths()
+        input_dir = input_dir or paths['input_dir']
+        output_file = output_file or paths['output']
+
+    section = SECTIONS_BY_NAME[name]
+    result = build_section(name, input_dir, report)
+    if result is False:
+        return False
+
+    data, js_code = result
+    if not write_js_sections(output_file, {name: js_code}, report=report):
+        return False
+
+    print(f"Successfully updated {output_file} with {section.label} data.")
+    return data
+
+
+def convert_education_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("educationList", input_dir, output_file)
+
+
+def convert_projects_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("projects", input_dir, output_file)
+
+
+def convert_volunteering_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("extraCurricular", input_dir, output_file)
+
+
+def convert_honors_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("achievements", input_dir, output_file)
+
+
+def convert_positions_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("experiences", input_dir, output_file)
+
+
+def convert_profile_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("aboutMe", input_dir, output_file)
+
+
+def convert_skills_csv_to_js(input_dir=None, output_file=None):
+    return convert_section("skills", input_dir, output_file)
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=4, default=record_json)
+
+
+def index_json_object(content):
+    """Map each top-level key of a JSON object to the (start, end) span of its value.
+
+    Values are only decoded to find where they end; nothing is kept, so
+    untouched values can be copied through as raw text.
+    """
+    def skip_whitespace(position):
+        return _JSON_WHITESPACE.match(content, position).end()
+
+    position = skip_whitespace(0)
+    if content[position:position + 1] != "{":
+        raise ValueError(f"Expecting a JSON object at char {position}")
+
+    index = {}
+    position = skip_whitespace(position + 1)
+    if content[position:position + 1] == "}":
+        return index
+
+    while True:
+        key, position = _JSON_DECODER.raw_decode(content, position)
+        position = skip_whitespace(position)
+        if not isinstance(key, str) or content[position:position + 1] != ":":
+            raise ValueError(f"Expecting a key and ':' delimiter at char {position}")
+
+        start = skip_whitespace(position + 1)
+        _, end = _JSON_DECODER.raw_decode(content, start)
+        # Like json.load, a repeated key keeps its first position and last value
+        index[key] = (start, end)
+
+        position = skip_whitespace(end)
+        delimiter = content[position:position + 1]
+        if delimiter == "}":
+            return index
+        if delimiter != ",":
+            raise ValueError(f"Expecting ',' delimiter at char {position}")
+        position = skip_whitespace(position + 1)
+
+
+def is_compact_json(content):
+    """Whether a JSON document was written without indentation"""
+    return content.lstrip()[1:2] not in (" ", "\t", "\n", "\r")
+
+
+def iter_json_value(value, compact=False):
+    """Yield the JSON of a top-level value of an object in chunks"""
+    # Records are turned into dicts before encoding rather than through the
+    # `default` hook, which the indenting encoder calls once per nested record
+    if isinstance(value, Record):
+        value = value.to_plain()
+
+    if compact:
+        if isinstance(value, list):
+            value = [item.to_plain() if isinstance(item, Record) else item for item in value]
+        yield json.dumps(value, separators=(",", ":"), default=record_json)
+        return
+
+    if not isinstance(value, list) or not value:
+        # Encode the value in one go, then indent its lines for its depth
+        # inside the object; one replace over the whole text beats one per chunk
+        yield _PRETTY_JSON_ENCODER.encode(value).replace("\n", "\n    ")
+        return
+
+    # Lists of records are encoded record by record, so only one of them is
+    # held as a dict and as text at a time
+    separator = "[\n        "
+    for item in value:
+        if isinstance(item, Record):
+            item = item.to_plain()
+        yield separator + _PRETTY_JSON_ENCODER.encode(item).replace("\n", "\n        ")
+        separator = ",\n        "
+    yield "\n    ]"
+
+
+def iter_json_object(members, compact=False):
+    """Yield a JSON object in chunks from (key, value chunks) pairs"""
+    yield "{"
+    separator = "," if compact else ",\n    "
+    first = True
+    for key, chunks in members:
+        if first:
+            yield "" if compact else "\n    "
+            first = False
+        else:
+            yield separator
+        yield json.dumps(key) + (":" if compact else ": ")
+        yield from chunks
+    yield "}" if compact or first else "\n}"
+
+
+# Fields that identify the same record across imports, per JSON section
+MERGE_KEYS = {
+    "educationList": ("title", "degree"),
+    "projects": ("title",),
+    "extraCurricular": ("organisation", "title"),
+    "achievements": ("event",),
+    "experiences": ("organisation",),
+    "skills": ("title",),
+}
+
+# Fields users curate by hand, with the placeholder the importer writes for
+# them; an imported placeholder never replaces an existing value
+CURATED_FIELDS = {
+    "icon": "FaRegImage",
+    "logo": "placeholder",
+    "image": "placeholder",
+    "link": "",
+    "github": "",
+    "article": "",
+    "project": "",
+    "youtube": "",
+    "stack": [{"id": "icon-1", "icon": "FaRegImage", "name": "Placeholder"}],
+    "githubUsername": "",
+    "intro": "This is a placeholder intro",
+}
+
+
+# Lists of records nested in a record, by field, with the fields that identify
+# the same nested record across imports
+NESTED_MERGE_KEYS = {
+    "items": ("name",),
+    "positions": ("title",),
+    "content": ("text",),
+}
+
+# Nested lists rebuilt from the import each time, such as the sentences of a
+# description; existing entries that were not imported again are dropped
+DERIVED_LISTS = {"content"}
+
+
+def merge_record(existing, imported):
+    """Update an existing record with imported fields, keeping curated ones.
+
+    Nested record lists in NESTED_MERGE_KEYS are merged record by record, so
+    curated fields are kept at every level.
+    """
+    merged = dict(imported)
+    for field, value in existing.items():
+        if field not in merged:
+            # Fields added by hand
+            merged[field] = value
+        elif field in NESTED_MERGE_KEYS and isinstance(value, list) and isinstance(merged[field], list):
+            merged[field] = merge_records(value, merged[field], NESTED_MERGE_KEYS[field],
+                                          keep_unmatched=field not in DERIVED_LISTS)
+        elif field in CURATED_FIELDS and merged[field] == CURATED_FIELDS[field]:
+            merged[field] = value
+    return merged
+
+
+def merge_records(existing, imported, key_fields, keep_unmatched=True):
+    """Upsert a list of imported records into a list of existing ones.
+
+    Records are matched by `key_fields`; matches are merged with merge_record
+    and keep the imported order. Existing records that were not imported are
+    kept after them if `keep_unmatched` is true.
+    """
+    def record_key(record):
+        return tuple(record.get(field) for field in key_fields) if isinstance(record, dict) else None
+
+    # Queue existing records per key so that duplicate keys match in order
+    unmatched = {}
+    for position, record in enumerate(existing):
+        unmatched.setdefault(record_key(record), deque()).append(position)
+
+    merged = []
+    matched = set()
+    for record in imported:
+        positions = unmatched.get(record_key(record))
+        if positions and isinstance(record, dict):
+            position = positions.popleft()
+            matched.add(position)
+            merged.append(merge_record(existing[position], record))
+        else:
+            merged.append(record)
+
+    if keep_unmatched:
+        merged.extend(record for position, record in enumerate(existing) if position not in matched)
+    return merged
+
+
+def merge_section(name, existing, imported):
+    """Upsert imported records into an existing JSON section.
+
+    List records are matched by the section's MERGE_KEYS with merge_records;
+    existing records that were not imported are kept after the imported ones.
+    """
+    if isinstance(existing, dict) and isinstance(imported, dict):
+        return merge_record(existing, imported)
+
+    key_fields = MERGE_KEYS.get(name)
+    if key_fields is None or not isinstance(existing, list) or not isinstance(imported, list):
+        return imported
+    return merge_records(existing, imported, key_fields)
+
+
+def json_pointer(*tokens):
+    """Build an RFC 6901 JSON Pointer from reference tokens"""
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def diff_json(old, new, path=""):
+    """Yield RFC 6902 JSON Patch operations that turn old into new"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                yield {"op": "remove", "path": path + json_pointer(key)}
+            else:
+                yield from diff_json(old[key], new[key], path + json_pointer(key))
+        for key in new:
+            if key not in old:
+                yield {"op": "add", "path": path + json_pointer(key), "value": new[key]}
+    elif isinstance(old, list) and isinstance(new, list):
+        for index in range(min(len(old), len(new))):
+            yield from diff_json(old[index], new[index], path + json_pointer(index))
+        # Remove from the end so that earlier indexes stay valid
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            yield {"op": "remove", "path": path + json_pointer(index)}
+        for index in range(len(old), len(new)):
+            yield {"op": "add", "path": path + json_pointer(index), "value": new[index]}
+    elif type(old) is not type(new) or old != new:
+        yield {"op": "replace", "path": path, "value": new}
+
+
 def update_json_file(education_entries=None, project_entries=None, volunteering_entries=None, 
                     honors_entries=None, experience_entries=None, profile_data=None, 
-                    skills_categories=None, json_file=None):
-    """Write all entries to a JSON file while preserving existing data"""
+                    skills_categories=None, json_file=None, compact=False, merge=False,
+                    patch_file=None):
+    """Write all entries to a JSON file while preserving existing data.
+
+    Only the given sections and missing defaults are serialized; the other
+    top-level values of the existing file are copied through as raw text
+    when it has the same layout. With compact=True the file is written
+    without indentation. With merge=True imported records are upserted into
+    the existing sections with merge_section instead of replacing them.
+    When `patch_file` is given, the changes are also written there as an
+    RFC 6902 JSON Patch. Returns the patch operations, or None.
+    """
     
     if json_file is None:
         json_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "constants.json")
 
-    # Load existing JSON data or create new
-    json_data = {}
-    if os.path.exists(json_file):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+    # Index existing JSON data without re-serializing it
+    content = read_text_file(json_file)
+    index = index_json_object(content) if content is not None else {}
+    copy_raw = content is not None and is_compact_json(content) == compact
 
     # Update with new data if provided
+    values = {}
     if education_entries is not None:
-        json_data['educationList'] = education_entries
+        values['educationList'] = education_entries
     
     if project_entries is not None:
-        json_data['projects'] = project_entries
+        values['projects'] = project_entries
     
     if volunteering_entries is not None:
-        json_data['extraCurricular'] = volunteering_entries
+        values['extraCurricular'] = volunteering_entries
     
     if honors_entries is not None:
-        json_data['achievements'] = honors_entries
+        values['achievements'] = honors_entries
     
     if experience_entries is not None:
-        json_data['experiences'] = experience_entries
+        values['experiences'] = experience_entries
     
     if profile_data is not None:
-        json_data['aboutMe'] = profile_data
+        values['aboutMe'] = profile_data
     
     if skills_categories is not None:
-        json_data['skills'] = skills_categories
+        values['skills'] = skills_categories
 
     # Ensure essential sections exist with default values
     defaults = {
-        'resumeLink': json_data.get('resumeLink', ""),
-        'callToAction': json_data.get('callToAction', "https://www.linkedin.com/in/<your-linkedin-id>/"),
-        'navLinks': json_data.get('navLinks', [
+        'resumeLink': "",
+        'callToAction': "https://www.linkedin.com/in/<your-linkedin-id>/",
+        'navLinks': [
             {"id": "skills", "title": "Skills & Experience"},
             {"id": "education", "title": "Education"},
             {"id": "achievements", "title": "Achievements"},
@@ -1047,31 +2380,879 @@ def update_json_file(education_entries=None, project_entries=None, volunteering_
             {"id": "openSource", "title": "Open Source"},
             {"id": "extraCurricular", "title": "Extra Curricular"},
             {"id": "contactMe", "title": "Contact Me"}
-        ]),
-        'itemsToFetch': json_data.get('itemsToFetch', 20),
-        'includedRepos': json_data.get('includedRepos', [
+        ],
+        'itemsToFetch': 20,
+        'includedRepos': [
             "publiclab/plots2",
             "zulip/zulip",
             "paritytech/polkadot-sdk"
-        ])
+        ]
     }
-    
-    # Update json_data with defaults
-    json_data.update(defaults)
+    for key, default in defaults.items():
+        if key not in index:
+            values[key] = default
+
+    # Compare against, or merge into, the existing values of updated sections
+    patch = [] if patch_file is not None else None
+    if merge or patch is not None:
+        for key in values:
+            if key not in index:
+                if patch is not None:
+                    patch.append({"op": "add", "path": json_pointer(key), "value": plain_data(values[key])})
+                continue
+            start, end = index[key]
+            existing = json.loads(content[start:end])
+            values[key] = plain_data(values[key])
+            if merge:
+                values[key] = merge_section(key, existing, values[key])
+            if patch is not None:
+                patch.extend(diff_json(existing, values[key], json_pointer(key)))
+
+    def members():
+        # Existing keys keep their position, new ones are appended
+        for key in list(index) + [key for key in values if key not in index]:
+            if key in values:
+                yield key, iter_json_value(values[key], compact)
+            elif copy_raw:
+                start, end = index[key]
+                yield key, [content[start:end]]
+            else:
+                start, end = index[key]
+                yield key, iter_json_value(json.loads(content[start:end]), compact)
+
+    # Stream the updated data to file
+    if write_file_atomic(json_file, iter_json_object(members(), compact)):
+        print(f"Successfully updated {json_file}")
+    else:
+        print(f"{json_file} is unchanged")
+
+    if patch is not None:
+        write_file_atomic(patch_file, json.dumps(patch, indent=4))
+        print(f"Wrote {len(patch)} JSON Patch operations to {patch_file}")
+    return patch
+
+
+def hash_text(text):
+    """Return the SHA-256 hex digest of a string"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_stream(stream):
+    """Return the SHA-256 hex digest of a binary stream"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file, or None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hash_stream(f)
+
+
+def hash_export_file(input_dir, filename):
+    """Return the SHA-256 hex digest of a CSV of the export, or None if missing"""
+    if is_export_archive(input_dir):
+        with zipfile.ZipFile(input_dir) as archive:
+            member = find_export_member(archive, filename)
+            if member is None:
+                return None
+            with archive.open(member) as raw:
+                return hash_stream(raw)
+    return hash_file(os.path.join(input_dir, filename))
+
+
+def get_manifest_path(json_file):
+    """Path of the incremental import manifest kept next to the JSON file"""
+    return os.path.splitext(json_file)[0] + ".manifest.json"
+
+
+def load_manifest(manifest_file, json_file, options):
+    """Load the per-section manifest of a previous incremental run.
+
+    Returns an empty dict when there is no usable manifest: a different tool
+    version or options, or a JSON file that changed since it was written.
+    """
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (manifest.get("tool_version") != TOOL_VERSION
+            or manifest.get("options") != options
+            or manifest.get("json_hash") != hash_file(json_file)):
+        return {}
+    return manifest.get("sections", {})
+
+
+def save_manifest(manifest_file, json_file, options, sections):
+    """Record input and output hashes of the current run"""
+    manifest = {
+        "tool_version": TOOL_VERSION,
+        "options": options,
+        "json_hash": hash_file(json_file),
+        "sections": sections,
+    }
+    write_file_atomic(manifest_file, json.dumps(manifest, indent=4))
+
+
+def _build_section_job(name, input_dir, options, trace_memory):
+    """Build a section in a worker process, returning its result and report stages"""
+    report = RunReport()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        result = build_section(name, input_dir, report, **options)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, report.stages
+
+
+def _gzip_compress(data):
+    # A fixed mtime keeps the output identical for identical content
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+# Pre-compressed variants of generated files by suffix, as (compress, decompress)
+ARTIFACT_ENCODINGS = {".gz": (_gzip_compress, gzip.decompress)}
+if brotli is not None:
+    ARTIFACT_ENCODINGS[".br"] = (lambda data: brotli.compress(data, quality=11), brotli.decompress)
+
+
+def compress_artifact(path, suffix):
+    """Write path + suffix at maximum compression unless its content is unchanged.
+
+    Returns True if the compressed file was written, False if it was up to date.
+    """
+    compress, decompress = ARTIFACT_ENCODINGS[suffix]
+    with open(path, "rb") as f:
+        data = f.read()
+
+    target = path + suffix
+    if os.path.exists(target):
+        try:
+            with open(target, "rb") as f:
+                if hashlib.sha256(decompress(f.read())).digest() == hashlib.sha256(data).digest():
+                    return False
+        except Exception:
+            # A truncated or corrupt artifact is simply rewritten
+            pass
+
+    write_file_atomic(target, compress(data))
+    return True
+
+
+def compress_artifacts(paths, jobs=1, report=None):
+    """Write .gz (and .br, with brotli installed) variants of generated files.
+
+    With jobs > 1 the files are compressed in a process pool. Returns a dict
+    mapping each compressed file to whether it was rewritten.
+    """
+    if report is None:
+        report = RunReport(enabled=False)
+
+    tasks = [(path, suffix) for path in paths if os.path.exists(path) for suffix in ARTIFACT_ENCODINGS]
+    with report.stage("all", "compress") as stage:
+        if jobs <= 1 or len(tasks) <= 1:
+            written = [compress_artifact(path, suffix) for path, suffix in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+                written = list(executor.map(compress_artifact, *zip(*tasks)))
+
+        results = {path + suffix: rewritten for (path, suffix), rewritten in zip(tasks, written)}
+        stage["bytes_read"] = sum(os.path.getsize(path) for path, _ in tasks)
+        stage["bytes_written"] = sum(os.path.getsize(target) for target, rewritten in results.items() if rewritten)
+
+    for target, rewritten in results.items():
+        if rewritten:
+            print(f"Successfully compressed {target}")
+    return results
+
+
+def build_sections(sections, input_dir, jobs=1, builder_options=None, report=None, render=True):
+    """Run the builders of the given sections and return their results in order.
+
+    `builder_options` maps section names to extra keyword arguments for their
+    builder. With jobs > 1 the builders run concurrently in a process pool. The largest
+    CSVs are submitted first so that the slowest sections start early, but
+    results are always returned in the order of `sections`, so the output is
+    identical to a serial run. Stages timed in the workers are added to `report`.
+    With render=False the sections are built serially and not rendered.
+    """
+    builder_options = builder_options or {}
+    if jobs <= 1 or len(sections) <= 1 or not render:
+        return [
+            build_section(section.name, input_dir, report, render=render, **builder_options.get(section.name, {}))
+            for section in sections
+        ]
+
+    def input_size(section):
+        return export_file_size(input_dir, section.csv_file)
+
+    profiled = report is not None and report.enabled
+    with ProcessPoolExecutor(max_workers=min(jobs, len(sections))) as executor:
+        futures = {}
+        for section in sorted(sections, key=input_size, reverse=True):
+            options = builder_options.get(section.name, {})
+            if profiled:
+                futures[section.name] = executor.submit(
+                    _build_section_job, section.name, input_dir, options, tracemalloc.is_tracing()
+                )
+            else:
+                futures[section.name] = executor.submit(build_section, section.name, input_dir, **options)
+
+        results = []
+        for section in sections:
+            result = futures[section.name].result()
+            if profiled:
+                result, stages = result
+                report.stages.extend(stages)
+            results.append(result)
+        return results
+
+
+def run_import(input_dir, output_file, json_file=None, incremental=False, jobs=1,
+               builder_options=None, report=None, compact_json=False, only=None,
+               merge_json=False, patch_file=None, modules_dir=None):
+    """Build every section, write the JS file once and update the JSON file.
+
+    In incremental mode a section is skipped when its CSV and its rendered
+    output in the JS file both match the manifest of the previous run; its
+    result is then None and the existing JS and JSON sections are kept.
+    With jobs > 1 the section builders run in parallel. `builder_options`
+    passes extra keyword arguments to individual section builders. Stage
+    timings are recorded in `report`, a RunReport, if one is given. With
+    compact_json=True the JSON file is written without indentation. `only`
+    restricts the run to the named sections; the others are left untouched.
+    `merge_json` and `patch_file` are passed to update_json_file. With
+    `modules_dir`, sections are written as ES modules there by
+    write_js_modules instead of being spliced into the JS file, which is then
+    only read for its imports. Otherwise, unless the run is incremental or
+    parallel, sections are rendered straight into the JS file and the
+    js_code of their results is None.
+    """
+    if json_file is None:
+        json_file = get_default_paths()['json_output']
+
+    builder_options = builder_options or {}
+
+    # Options that change the rendered output; a mismatch invalidates the manifest
+    taxonomy_file = builder_options.get("skills", {}).get("taxonomy_file")
+    options = {
+        "skill_taxonomy": hash_file(taxonomy_file or get_default_paths()['skill_taxonomy']),
+        "compact_json": compact_json,
+        "merge_json": merge_json,
+        "stable_ids": any(opts.get("stable_ids", False) for opts in builder_options.values()),
+    }
+    manifest_file = get_manifest_path(json_file)
+    previous = load_manifest(manifest_file, json_file, options) if incremental else {}
+
+    # The manifest needs the rendered text of each section, and parallel
+    # builds and modules render in the builders; other runs stream the JS
+    stream = not incremental and jobs <= 1 and modules_dir is None
+
+    content = read_text_file(output_file)
+    index = index_js_sections(content) if previous and content is not None and modules_dir is None else {}
+
+    results = {}
+    input_hashes = {}
+    manifest_sections = {}
+    pending = []
+    for section in SECTIONS:
+        if only is not None and section.name not in only:
+            results[section.name] = None
+            if section.name in previous:
+                manifest_sections[section.name] = previous[section.name]
+            continue
+        if incremental:
+            input_hash = hash_export_file(input_dir, section.csv_file)
+            input_hashes[section.name] = input_hash
+            entry = previous.get(section.name)
+            output_hash = None
+            if modules_dir is not None and section.name in previous:
+                module = read_text_file(js_module_path(modules_dir, section.name))
+                span = index_js_sections(module).get(section.name) if module else None
+                if span:
+                    output_hash = hash_text(module[span[0]:span[1]])
+            elif section.name in index:
+                start, end = index[section.name]
+                output_hash = hash_text(content[start:end])
+            if entry == {"input_hash": input_hash, "output_hash": output_hash}:
+                results[section.name] = None
+                manifest_sections[section.name] = entry
+                continue
+        pending.append(section)
+
+    built = build_sections(pending, input_dir, jobs, builder_options, report, render=not stream)
+    for section, result in zip(pending, built):
+        results[section.name] = result
+        if stream:
+            continue
+        input_hash = input_hashes.get(section.name)
+        if result is not False:
+            manifest_sections[section.name] = {
+                "input_hash": input_hash,
+                "output_hash": hash_text(result[1].strip()),
+            }
+        elif input_hash is None:
+            # Remember missing inputs so they do not force a rewrite every run
+            manifest_sections[section.name] = {"input_hash": None, "output_hash": None}
+
+    # Keep results in section order regardless of how they were built
+    results = {section.name: results[section.name] for section in SECTIONS}
+    manifest_sections = {
+        section.name: manifest_sections[section.name]
+        for section in SECTIONS if section.name in manifest_sections
+    }
+
+    if incremental and all(result is None for result in results.values()):
+        print(f"No changes detected; {output_file} and {json_file} are up to date.")
+        if patch_file is not None:
+            write_file_atomic(patch_file, "[]")
+        return results
+
+    # Splice all rendered sections in with a single write
+    sections = {
+        name: result[1] if result[1] is not None else
+        section_js_writer(name, result[0], report, builder_options.get(name, {}).get("fragment_cache"),
+                          builder_options.get(name, {}).get("stable_ids", False))
+        for name, result in results.items() if result
+    }
+    labels = ", ".join(SECTIONS_BY_NAME[name].label for name in sections)
+    if modules_dir is not None:
+        if sections and write_js_modules(modules_dir, sections, content, output_file, report):
+            print(f"Successfully wrote {labels} modules to {modules_dir}.")
+    elif sections and write_js_sections(output_file, sections, content, report):
+        print(f"Successfully updated {output_file} with {labels} data.")
+
+    # Update JSON file with all data, passing False through for failed sections
+    json_args = {}
+    for section in SECTIONS:
+        result = results[section.name]
+        json_args[section.json_arg] = result[0] if result else result
+
+    if report is None:
+        update_json_file(json_file=json_file, compact=compact_json, merge=merge_json, patch_file=patch_file,
+                         **json_args)
+    else:
+        with report.stage("all", "update_json_file") as stage:
+            if os.path.exists(json_file):
+                stage["bytes_read"] = os.path.getsize(json_file)
+            update_json_file(json_file=json_file, compact=compact_json, merge=merge_json, patch_file=patch_file,
+                             **json_args)
+            stage["bytes_written"] = os.path.getsize(json_file)
+
+    if incremental:
+        save_manifest(manifest_file, json_file, options, manifest_sections)
+    return results
+
+
+def import_streams(sources, output_file=None, json_file=None, builder_options=None, compact_json=False,
+                   merge_json=False):
+    """Convert CSVs held in memory, writing the results only if asked to.
+
+    `sources` maps section names or CSV file names (e.g. "Skills.csv") to
+    anything convert_rows accepts. Returns {section name: SectionResult} in
+    section order, with False for sections that could not be converted.
+    Raises ValueError for keys that name no section or CSV file.
+    The sections are spliced into `output_file` and their data is written to
+    `json_file` only when those paths are given.
+    """
+    builder_options = builder_options or {}
+    by_csv_file = {section.csv_file: section.name for section in SECTIONS}
+    sources = {by_csv_file.get(key, key): source for key, source in sources.items()}
+    unknown = sorted(name for name in sources if name not in SECTIONS_BY_NAME)
+    if unknown:
+        raise ValueError(f"Unknown section or CSV file: {', '.join(unknown)}")
+
+    results = {}
+    for section in SECTIONS:
+        if section.name not in sources:
+            continue
+        try:
+            results[section.name] = convert_rows(section.name, sources[section.name],
+                                                 **builder_options.get(section.name, {}))
+        except Exception as e:
+            print(f"Error converting {section.label} data: {e}")
+            results[section.name] = False
+
+    converted = {name: result for name, result in results.items() if result}
+    if output_file is not None and converted:
+        write_js_sections(output_file, {name: result.js_code for name, result in converted.items()})
+    if json_file is not None:
+        json_args = {SECTIONS_BY_NAME[name].json_arg: result.data for name, result in converted.items()}
+        update_json_file(json_file=json_file, compact=compact_json, merge=merge_json, **json_args)
+    return results
+
+
+# Builder options naming cache directories that an import writes to
+CACHE_OPTIONS = ("row_cache", "fragment_cache")
+
+
+def check_import(input_dir, output_file, json_file=None, modules_dir=None, **options):
+    """Return the generated files an import would change, without writing any.
+
+    The import runs against scratch copies of the JS file (or the section
+    modules), the JSON file and its manifest, and each result is compared
+    with the file on disk. `options` are passed to run_import, without the
+    row and fragment caches, which would otherwise be written to.
+    """
+    if json_file is None:
+        json_file = get_default_paths()['json_output']
+
+    options["builder_options"] = {
+        name: {key: value for key, value in section_options.items() if key not in CACHE_OPTIONS}
+        for name, section_options in (options.get("builder_options") or {}).items()
+    }
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        # Mirror the layout of the JS file and the modules so that relative
+        # imports are rebased exactly as in a real run
+        js_dirs = [os.path.dirname(os.path.abspath(output_file))]
+        if modules_dir is not None:
+            js_dirs.append(os.path.abspath(modules_dir))
+        base = os.path.commonpath(js_dirs)
+
+        def scratch(path):
+            return os.path.join(work_dir, "js", os.path.relpath(os.path.abspath(path), base))
+
+        scratch_output = scratch(output_file)
+        scratch_modules = None if modules_dir is None else scratch(modules_dir)
+        scratch_json = os.path.join(work_dir, "json", os.path.basename(json_file))
+
+        outputs = list(zip(output_js_files(output_file, modules_dir),
+                           output_js_files(scratch_output, scratch_modules)))
+        outputs.append((json_file, scratch_json))
+        copies = outputs + [(output_file, scratch_output),
+                            (get_manifest_path(json_file), get_manifest_path(scratch_json))]
+        for path, scratch_path in copies:
+            if os.path.exists(path):
+                os.makedirs(os.path.dirname(scratch_path), exist_ok=True)
+                shutil.copy2(path, scratch_path)
+
+        with redirect_stdout(io.StringIO()):
+            run_import(input_dir, scratch_output, scratch_json, modules_dir=scratch_modules, **options)
+
+        return [
+            path for path, scratch_path in outputs
+            if os.path.exists(scratch_path)
+            and not (os.path.exists(path) and same_file_content(scratch_path, path))
+        ]
+    finally:
+        shutil.rmtree(work_dir)
+
+
+# Seconds between polls of the watched export, and of quiet time required
+# after a change before the affected sections are regenerated
+WATCH_INTERVAL = 0.05
+WATCH_DEBOUNCE = 0.05
+
+
+def snapshot_export(input_dir):
+    """Return a {csv_file: signature} map that changes whenever a CSV does"""
+    snapshot = {}
+    if is_export_archive(input_dir):
+        try:
+            with zipfile.ZipFile(input_dir) as archive:
+                for section in SECTIONS:
+                    member = find_export_member(archive, section.csv_file)
+                    if member is not None:
+                        info = archive.getinfo(member)
+                        snapshot[section.csv_file] = (info.CRC, info.file_size)
+        except (OSError, zipfile.BadZipFile):
+            # The archive is being replaced; the next poll will see it
+            pass
+        return snapshot
+
+    for section in SECTIONS:
+        try:
+            stat = os.stat(os.path.join(input_dir, section.csv_file))
+        except OSError:
+            continue
+        snapshot[section.csv_file] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def changed_sections(before, after):
+    """Names of the sections whose CSV differs between two snapshots"""
+    return [
+        section.name for section in SECTIONS
+        if before.get(section.csv_file) != after.get(section.csv_file)
+    ]
+
+
+def watch_export(input_dir, output_file, json_file=None, compress=False, stop_event=None,
+                 interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE, **options):
+    """Regenerate the sections whose CSVs change until interrupted or stopped.
+
+    The export is polled every `interval` seconds; once a change has been
+    quiet for `debounce` seconds, only the affected sections are rebuilt,
+    spliced into the JS file and patched into the JSON file. Sections whose
+    CSV has gone are left as they are. `options` are passed to run_import.
+    """
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    snapshot = snapshot_export(input_dir)
+    print(f"Watching {input_dir} for changes. Press Ctrl+C to stop.")
+    try:
+        while not stop_event.wait(interval):
+            current = snapshot_export(input_dir)
+            if current == snapshot:
+                continue
+
+            # Wait for the export to settle, e.g. while a CSV is being written
+            while not stop_event.wait(debounce):
+                settled = snapshot_export(input_dir)
+                if settled == current:
+                    break
+                current = settled
+            else:
+                break
+
+            # A CSV that disappeared, e.g. while a ZIP is replaced, keeps its
+            # existing JS and JSON sections instead of being written as missing
+            names = [name for name in changed_sections(snapshot, current)
+                     if SECTIONS_BY_NAME[name].csv_file in current]
+            snapshot = current
+            if not names:
+                continue
+            start = time.perf_counter()
+            run_import(input_dir, output_file, json_file, only=names, **options)
+            if compress:
+                compress_artifacts(output_js_files(output_file, options.get("modules_dir"))
+                                   + [json_file or get_default_paths()['json_output']])
+            labels = ", ".join(SECTIONS_BY_NAME[name].label for name in names)
+            print(f"Regenerated {labels} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        pass
+    print("Stopped watching.")
+
+
+# One import of a batch: a profile name, its export and where to write it
+BatchJob = namedtuple("BatchJob", ["profile", "input_dir", "output_file", "json_file"])
+
+
+def find_batch_jobs(batch_path, output_dir=None):
+    """List the imports of a batch.
+
+    `batch_path` is either a directory whose subdirectories and ZIP files are
+    LinkedIn exports, written to `output_dir/<profile>/`, or a JSON manifest
+    listing {"input", "output", "json_output"} objects. In a directory,
+    `output_dir` and entries holding none of the section CSVs are skipped.
+    Relative manifest paths are resolved against the manifest's directory;
+    "json_output" defaults to constants.json next to "output".
+    """
+    jobs = []
+    if os.path.isdir(batch_path):
+        for name in sorted(os.listdir(batch_path)):
+            input_dir = os.path.join(batch_path, name)
+            if not (os.path.isdir(input_dir) or is_export_archive(input_dir)):
+                continue
+            if output_dir is not None and os.path.abspath(input_dir) == os.path.abspath(output_dir):
+                continue
+            if not any(export_file_exists(input_dir, section.csv_file) for section in SECTIONS):
+                continue
+            profile = os.path.splitext(name)[0] if is_export_archive(input_dir) else name
+            jobs.append(BatchJob(
+                profile,
+                input_dir,
+                os.path.join(output_dir, profile, "index-example.js"),
+                os.path.join(output_dir, profile, "constants.json"),
+            ))
+        return jobs
+
+    with open(batch_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(batch_path))
+    for entry in entries:
+        input_dir = os.path.join(base_dir, entry["input"])
+        output_file = os.path.join(base_dir, entry["output"])
+        json_file = os.path.join(base_dir, entry.get("json_output")
+                                 or os.path.join(os.path.dirname(entry["output"]), "constants.json"))
+        profile = entry.get("profile") or os.path.splitext(os.path.basename(entry["input"].rstrip("/\\")))[0]
+        jobs.append(BatchJob(profile, input_dir, output_file, json_file))
+    return jobs
+
+
+def _warm_batch_worker(taxonomy_file):
+    """Compile shared state once per worker process instead of once per import"""
+    load_skill_taxonomy(taxonomy_file)
+
+
+def run_batch_job(job, compress=False, **options):
+    """Run one import of a batch quietly and return (profile, status, detail).
+
+    The status is "ok", "partial" when some CSVs were missing or unreadable,
+    or "failed" when all of them were or the import raised. An input without
+    any section CSV is not imported. `options` are passed to run_import.
+    """
+    if not any(export_file_exists(job.input_dir, section.csv_file) for section in SECTIONS):
+        return job.profile, "failed", "no LinkedIn export CSVs found"
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            results = run_import(job.input_dir, job.output_file, job.json_file, **options)
+            if compress:
+                compress_artifacts([job.output_file, job.json_file])
+    except Exception as e:
+        return job.profile, "failed", str(e)
+
+    missing = [SECTIONS_BY_NAME[name].label for name, result in results.items() if result is False]
+    if len(missing) == len(results):
+        return job.profile, "failed", "every section CSV is missing or unreadable"
+    if missing:
+        return job.profile, "partial", f"missing {', '.join(missing)}"
+    return job.profile, "ok", ""
+
+
+def run_batch(batch_jobs, jobs=1, compress=False, **options):
+    """Import many exports in one process, on a pool of `jobs` long-lived workers.
+
+    Workers are reused across imports, so the skill taxonomy and the other
+    cached state are compiled once per worker. Prints a per-profile summary
+    and returns the (profile, status, detail) tuples in batch order.
+    """
+    taxonomy_file = options.get("builder_options", {}).get("skills", {}).get("taxonomy_file")
+    if jobs <= 1 or len(batch_jobs) <= 1:
+        _warm_batch_worker(taxonomy_file)
+        summary = [run_batch_job(job, compress, **options) for job in batch_jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batch_jobs)), initializer=_warm_batch_worker,
+                                 initargs=(taxonomy_file,)) as executor:
+            futures = [executor.submit(run_batch_job, job, compress, **options) for job in batch_jobs]
+            summary = [future.result() for future in futures]
+
+    for profile, status, detail in summary:
+        print(f"{profile}: {status}" + (f" ({detail})" if detail else ""))
+    failed = sum(status == "failed" for _, status, _ in summary)
+    print(f"Batch finished: {len(summary) - failed} of {len(summary)} profiles imported.")
+    return summary
+
+
+def hash_export(input_dir):
+    """Return a digest of every section CSV of an export, identifying its content"""
+    digest = hashlib.sha256()
+    for section in SECTIONS:
+        digest.update(f"{section.csv_file}:{hash_export_file(input_dir, section.csv_file)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_export(input_dir, options):
+    """Import an export into a scratch directory and return its generated files.
+
+    Returns a dict with the JS source, the JSON text and the labels of the
+    sections whose CSV was missing or unreadable.
+    """
+    work_dir = tempfile.mkdtemp()
+    try:
+        output_file = os.path.join(work_dir, "index-example.js")
+        json_file = os.path.join(work_dir, "constants.json")
+        with redirect_stdout(io.StringIO()):
+            results = run_import(input_dir, output_file, json_file, **options)
+        return {
+            "js": read_text_file(output_file) or "",
+            "json": read_text_file(json_file),
+            "missing": [SECTIONS_BY_NAME[name].label for name, result in results.items() if result is False],
+        }
+    finally:
+        shutil.rmtree(work_dir)
+
+
+class ImportService:
+    """Run imports on a pre-forked worker pool, coalescing identical requests.
+
+    Requests for the same input hash that arrive while a job is in flight
+    wait for that job instead of starting another one. `options` are passed
+    to run_import.
+    """
+
+    def __init__(self, workers=1, **options):
+        self.options = options
+        taxonomy_file = options.get("builder_options", {}).get("skills", {}).get("taxonomy_file")
+        self.pool = multiprocessing.Pool(workers, initializer=_warm_batch_worker, initargs=(taxonomy_file,))
+        self.lock = threading.Lock()
+        self.in_flight = {}
+
+    def run(self, input_hash, input_dir):
+        """Return the render_export result for an export, sharing in-flight jobs"""
+        with self.lock:
+            job = self.in_flight.get(input_hash)
+            owner = job is None
+            if owner:
+                job = self.pool.apply_async(render_export, (input_dir, self.options))
+                self.in_flight[input_hash] = job
+        try:
+            return job.get()
+        finally:
+            if owner:
+                with self.lock:
+                    del self.in_flight[input_hash]
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+class ImportRequestHandler(BaseHTTPRequestHandler):
+    """POST /import with a ZIP export as the body, or {"input": path} as JSON.
+
+    Responds with {"js": ..., "json": ..., "missing": [...]}, where "json"
+    is the generated constants.json object.
+    """
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/import":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        upload = None
+        try:
+            if self.headers.get("Content-Type", "").split(";")[0].strip() == "application/json":
+                payload = json.loads(body or b"{}")
+                if not isinstance(payload, dict):
+                    self.send_json(400, {"error": 'Expecting a JSON object like {"input": path}'})
+                    return
+                input_dir = payload.get("input")
+                if (not isinstance(input_dir, str) or not input_dir
+                        or not (os.path.isdir(input_dir) or is_export_archive(input_dir))):
+                    self.send_json(400, {"error": f"Export {input_dir!r} not found"})
+                    return
+                input_hash = hash_export(input_dir)
+            else:
+                # The body is the export ZIP itself
+                fd, upload = tempfile.mkstemp(suffix=".zip")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                if not zipfile.is_zipfile(upload):
+                    self.send_json(400, {"error": "Request body is not a ZIP export"})
+                    return
+                input_dir = upload
+                input_hash = hashlib.sha256(body).hexdigest()
+
+            result = self.server.service.run(input_hash, input_dir)
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self.send_json(500, {"error": str(e)})
+            return
+        finally:
+            if upload is not None:
+                os.remove(upload)
+
+        # Embed the generated JSON as is instead of parsing it again
+        response = '{"js": %s, "json": %s, "missing": %s}' % (
+            json.dumps(result["js"]), result["json"], json.dumps(result["missing"])
+        )
+        self.send_body(200, response)
+
+    def send_json(self, status, payload):
+        self.send_body(status, json.dumps(payload))
+
+    def send_body(self, status, text):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+
+class UnixImportServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def create_import_server(service, port=None, socket_path=None, host="127.0.0.1"):
+    """Create an HTTP server for `service` on host:port, or on a Unix socket"""
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixImportServer(socket_path, ImportRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ImportRequestHandler)
+    server.service = service
+    return server
+
+
+def serve_imports(port=None, socket_path=None, workers=1, **options):
+    """Serve POST /import until interrupted; `options` are passed to run_import"""
+    service = ImportService(workers, **options)
+    server = create_import_server(service, port, socket_path)
+    where = socket_path or "http://%s:%s" % server.server_address[:2]
+    print(f"Serving imports on {where} with {workers} workers. Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
 
-    # Write updated data to file
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=4)
-        
-    print(f"Successfully updated {json_file}")
 
 def main():
     parser = argparse.ArgumentParser(description='Convert LinkedIn export CSV files to JS format')
     
     # Add arguments for input directory and output file
-    parser.add_argument('--input-dir', help='Directory containing LinkedIn export CSV files')
+    parser.add_argument('--input-dir',
+                        help='Directory containing LinkedIn export CSV files, or the downloaded export ZIP')
     parser.add_argument('--output', help='Path to output JS file')
     parser.add_argument('--json-output', help='Path to output JSON file')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip sections whose CSV is unchanged since the last incremental run')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of worker processes used to build sections in parallel')
+    parser.add_argument('--positions-memory-budget', type=int, default=POSITIONS_MEMORY_BUDGET,
+                        help='Rows of Positions.csv kept in memory before spilling to disk')
+    parser.add_argument('--skill-taxonomy',
+                        help='JSON file with the skill categories and keywords used to classify Skills.csv')
+    parser.add_argument('--compact-json', action='store_true',
+                        help='Write the JSON file without indentation, for production builds')
+    parser.add_argument('--merge', action='store_true',
+                        help='Upsert imported records into the existing JSON sections, keeping curated fields')
+    parser.add_argument('--json-patch', metavar='PATH',
+                        help='Write the changes made to the JSON file as an RFC 6902 JSON Patch')
+    parser.add_argument('--modules-dir', metavar='DIR',
+                        help='Write each section as an ES module in DIR, with an index.js barrel, '
+                             'instead of splicing it into --output')
+    parser.add_argument('--row-cache', metavar='DIR',
+                        help='Cache each parsed CSV in DIR as a memory-mapped columnar table keyed by file hash')
+    parser.add_argument('--stable-ids', action='store_true',
+                        help='Derive entry IDs from their content instead of their row number')
+    parser.add_argument('--fragment-cache', metavar='DIR',
+                        help='Reuse rendered entries cached in DIR across runs (requires --stable-ids)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Also write gzip (and brotli, if installed) variants of the JS and JSON files')
+    parser.add_argument('--batch', metavar='PATH',
+                        help='Import every export in a directory, or every entry of a JSON manifest of '
+                             'input/output pairs, on a pool of --jobs workers')
+    parser.add_argument('--watch', action='store_true',
+                        help='After importing, keep running and regenerate the sections whose CSVs change')
+    parser.add_argument('--output-dir', help='Directory receiving one subdirectory per profile with --batch')
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help='Serve imports over HTTP on localhost:PORT instead of importing once')
+    parser.add_argument('--serve-socket', metavar='PATH',
+                        help='Serve imports over HTTP on a Unix socket instead of importing once')
+    parser.add_argument('--check', action='store_true',
+                        help='Write nothing; exit with status 1 if the import would change any output file')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print the time, rows, bytes and peak memory of every import stage')
+    parser.add_argument('--report', metavar='PATH',
+                        help='Write the stage profile as JSON to PATH and as a Prometheus textfile next to it')
     
     args = parser.parse_args()
     
@@ -1082,35 +3263,85 @@ def main():
     output_file = args.output or paths['output']
     json_file = getattr(args, 'json_output', None) or paths.get('json_output')
     
-    # Create variables to store data
-    education_data = []
-    project_data = []
-    volunteering_data = []
-    honors_data = []
-    experience_data = []
-    profile_data = {}
-    skills_data = []
-    
-    # Convert CSV files to data structures
-    education_data = convert_education_csv_to_js(input_dir, output_file)
-    project_data = convert_projects_csv_to_js(input_dir, output_file)
-    volunteering_data = convert_volunteering_csv_to_js(input_dir, output_file)
-    honors_data = convert_honors_csv_to_js(input_dir, output_file)
-    experience_data = convert_positions_csv_to_js(input_dir, output_file)
-    profile_data = convert_profile_csv_to_js(input_dir, output_file)
-    skills_data = convert_skills_csv_to_js(input_dir, output_file)
-    
-    # Update JSON file with all data
-    update_json_file(
-        education_entries=education_data,
-        project_entries=project_data,
-        volunteering_entries=volunteering_data,
-        honors_entries=honors_data,
-        experience_entries=experience_data,
-        profile_data=profile_data,
-        skills_categories=skills_data,
-        json_file=json_file
-    )
+    builder_options = {
+        'experiences': {'max_rows_in_memory': args.positions_memory_budget},
+        'skills': {'taxonomy_file': args.skill_taxonomy},
+    }
+    if args.fragment_cache and not args.stable_ids:
+        parser.error('--fragment-cache requires --stable-ids')
+    if args.stable_ids:
+        for name in STABLE_ID_SECTIONS:
+            builder_options.setdefault(name, {})['stable_ids'] = True
+    if args.row_cache:
+        for section in SECTIONS:
+            builder_options.setdefault(section.name, {})['row_cache'] = os.path.abspath(args.row_cache)
+    if args.fragment_cache:
+        for name in CACHED_SECTIONS:
+            builder_options[name]['fragment_cache'] = os.path.abspath(args.fragment_cache)
+    import_options = {
+        'builder_options': builder_options,
+        'compact_json': args.compact_json,
+        'merge_json': args.merge,
+    }
+
+    if args.modules_dir and (args.serve is not None or args.serve_socket or args.batch):
+        parser.error('--modules-dir is not supported with --serve, --serve-socket or --batch')
+
+    if args.check:
+        if args.serve is not None or args.serve_socket or args.batch or args.watch:
+            parser.error('--check is not supported with --serve, --serve-socket, --batch or --watch')
+        if args.json_patch or args.compress or args.profile or args.report:
+            parser.error('--check writes nothing, so it cannot be combined with --json-patch, --compress, '
+                         '--profile or --report')
+
+        changed = check_import(input_dir, output_file, json_file, modules_dir=args.modules_dir,
+                               incremental=args.incremental, jobs=args.jobs, **import_options)
+        for path in changed:
+            print(f"Would change {path}")
+        if changed:
+            raise SystemExit(1)
+        print("All outputs are up to date.")
+        return
+
+    if args.serve is not None or args.serve_socket:
+        serve_imports(args.serve, args.serve_socket, workers=args.jobs, **import_options)
+        return
+
+    if args.batch:
+        if os.path.isdir(args.batch) and not args.output_dir:
+            parser.error('--output-dir is required when --batch is a directory of exports')
+        if args.profile or args.report or args.watch or args.json_patch:
+            parser.error('--profile, --report, --watch and --json-patch are not supported with --batch')
+
+        summary = run_batch(find_batch_jobs(args.batch, args.output_dir), jobs=args.jobs,
+                            compress=args.compress, incremental=args.incremental, **import_options)
+        if any(status == "failed" for _, status, _ in summary):
+            raise SystemExit(1)
+        return
+
+    report = None
+    if args.profile or args.report:
+        report = RunReport()
+        tracemalloc.start()
+
+    try:
+        run_import(input_dir, output_file, json_file, incremental=args.incremental, jobs=args.jobs,
+                   report=report, patch_file=args.json_patch, modules_dir=args.modules_dir, **import_options)
+        if args.compress:
+            compress_artifacts(output_js_files(output_file, args.modules_dir) + [json_file], jobs=args.jobs,
+                               report=report)
+    finally:
+        if report is not None:
+            tracemalloc.stop()
+
+    if args.profile:
+        print(report.format_table())
+    if args.report:
+        report.write(args.report)
+
+    if args.watch:
+        watch_export(input_dir, output_file, json_file, compress=args.compress, patch_file=args.json_patch,
+                     modules_dir=args.modules_dir, **import_options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""Sentence and bullet splitting for LinkedIn description fields.
+
+Shared by the importer's converters and its tokenizer benchmark.
+"""
+import re
+from itertools import groupby
+
+
+# Abbreviations whose trailing period does not end a sentence
+SENTENCE_ABBREVIATIONS = (
+    "e.g", "i.e", "vs", "approx", "incl", "cf", "fig",
+    "mr", "mrs", "dr", "prof", "jr", "sr", "st",
+)
+
+DESCRIPTION_BULLET = "•"
+
+# A sentence runs up to a run of periods followed by whitespace or the end of
+# the text. Periods followed by a non-space (decimals, version numbers, URLs)
+# or closing one of the abbreviations above do not end it. Lookbehinds must be
+# fixed-width, so abbreviations are grouped by length.
+_ABBREVIATION_PERIODS = "".join(
+    r"|\.(?<=\b(?:%s)\.)" % "|".join(map(re.escape, group))
+    for _, group in groupby(sorted(SENTENCE_ABBREVIATIONS, key=len), key=len)
+)
+_SENTENCE = re.compile(
+    r"[^.]*(?:(?:\.(?=\S)" + _ABBREVIATION_PERIODS + r")[^.]*)*\.*",
+    re.IGNORECASE,
+)
+# A period that keeps ". " from marking every sentence end: one followed by
+# something other than a single space, or closing an abbreviation
+_IRREGULAR_PERIOD = re.compile(
+    r"\.(?! |\Z)|(?:" + _ABBREVIATION_PERIODS[1:] + ") ",
+    re.IGNORECASE,
+)
+
+
+def split_sentences(text):
+    """Split text into stripped sentences in a single regex scan.
+
+    Plain prose takes a fast path through str.split instead. Sentences keep
+    their closing period; the last one has none if the text did not end with
+    one. Fragments made only of periods are dropped.
+    """
+    if _IRREGULAR_PERIOD.search(text):
+        return [
+            sentence for sentence in map(str.strip, _SENTENCE.findall(text))
+            if sentence.rstrip(".")
+        ]
+
+    # In plain prose every ". " ends a sentence, so str.split finds them
+    # faster than the regex
+    pieces = text.split(". ")
+    sentences = [sentence + "." for sentence in map(str.lstrip, pieces[:-1]) if sentence]
+    last = pieces[-1].strip()
+    if last.rstrip("."):
+        sentences.append(last)
+    return sentences
+
+
+def split_description(text, bullets=False):
+    """Split a description into content items.
+
+    With bullets=True, text containing "•" is split into its bullet points;
+    otherwise it is split into sentences.
+    """
+    if bullets and DESCRIPTION_BULLET in text:
+        return [item.strip() for item in text.split(DESCRIPTION_BULLET) if item.strip()]
+    return split_sentences(text)
@@ -1,9 +1,24 @@
 import unittest
 import os
 import csv
+import gzip
+import http.client
+import io
+import json
 import tempfile
 import shutil
+import threading
+import time
+import zipfile
+from datetime import datetime
+from unittest import mock
+
+import snippets.bulk_import_from_linkedin as bulk_import
 from snippets.bulk_import_from_linkedin import (
+    ARTIFACT_ENCODINGS,
+    compress_artifacts,
+    convert_rows,
+    create_import_server,
     convert_education_csv_to_js,
     convert_projects_csv_to_js,
     convert_volunteering_csv_to_js,
@@ -11,9 +26,39 @@ from snippets.bulk_import_from_linkedin import (
     convert_positions_csv_to_js,
     convert_profile_csv_to_js,
     convert_skills_csv_to_js,
-    get_default_paths
+    build_positions_section,
+    build_section,
+    changed_sections,
+    check_import,
+    build_skills_section,
+    date_sort_key,
+    find_batch_jobs,
+    FragmentCache,
+    format_date,
+    get_default_paths,
+    hash_export,
+    import_streams,
+    ImportService,
+    parse_date,
+    index_js_sections,
+    load_row_table,
+    merge_section,
+    parse_row_table,
+    ProjectEntry,
+    render_section_js,
+    RunReport,
+    run_batch,
+    run_import,
+    splice_js_sections,
+    update_json_file,
+    watch_export,
+    write_section_js
 )
 
+from snippets.description_tokenizer import split_description, split_sentences
+from snippets.bench_bulk_import import compare_to_baseline, generate_export, run_workload
+
+
 class TestLinkedInImport(unittest.TestCase):
     def setUp(self):
         # Create a temporary directory for test files
@@ -147,7 +192,7 @@ class TestLinkedInImport(unittest.TestCase):
         self.assertIn('link: ""', output)    # Empty URL
         
         # Verify description handling
-        self.assertIn('content:\n      "First project description with "quotes" and special chars: !@#$%^&*()"', output)
+        self.assertIn('content:\n      "First project description with \\"quotes\\" and special chars: !@#$%^&*()"', output)
         self.assertIn('content:\n      "Second project description"', output)
         self.assertIn('content:\n      ""', output)  # Empty description
         
@@ -311,8 +356,8 @@ class TestLinkedInImport(unittest.TestCase):
         self.assertIn('content2: ""', output)
         self.assertIn('content3: ""', output)
         
-        # Verify special character handling - using the actual format from the output
-        self.assertIn('content1: "Sentence with "quotes" and special chars: !@#$%^&*()"', output)
+        # Verify special character handling - quotes are escaped in JS string literals
+        self.assertIn('content1: "Sentence with \\"quotes\\" and special chars: !@#$%^&*()"', output)
         
         # Verify ID generation
         self.assertIn('id: "a-1"', output)
@@ -437,6 +482,26 @@ class TestLinkedInImport(unittest.TestCase):
         self.assertIn('content: [', output)
         self.assertIn('link: ""', output)  # Verify link field in content items
 
+    def test_positions_spill_matches_in_memory(self):
+        # Test that spilling the company group-by to disk does not change the output
+        headers = ['Company Name', 'Title', 'Started On', 'Finished On', 'Description']
+        rows = []
+        for i in range(50):
+            rows.append({
+                'Company Name': f'Company {i % 7}',
+                'Title': f'Role {i}',
+                'Started On': f'Jan {2000 + i % 20}',
+                'Finished On': '' if i % 5 == 0 else f'Dec {2001 + i % 20}',
+                'Description': f'Worked on item {i}.\nShipped it.'
+            })
+        self.create_test_csv('Positions.csv', headers, rows)
+
+        in_memory = build_positions_section(self.linkedin_export_dir)
+        spilled = build_positions_section(self.linkedin_export_dir, max_rows_in_memory=4)
+        self.assertEqual(in_memory, spilled)
+        self.assertEqual([entry['organisation'] for entry in spilled[0]],
+                         [f'Company {i}' for i in range(7)])
+
     def test_profile_conversion(self):
         # Test data
         headers = ['First Name', 'Last Name', 'Headline']
@@ -569,6 +634,55 @@ class TestLinkedInImport(unittest.TestCase):
         self.assertNotIn('FaRegImage', frameworks_section, "Frameworks should not use FaRegImage")
         self.assertNotIn('Si', tools_section, "Tools should not use Si icons")
 
+    def test_zip_input_matches_directory(self):
+        # Test that the downloaded export ZIP can be read without extracting it
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'React'}, {'Name': 'Git'}])
+        archive_path = os.path.join(self.test_dir, 'export.zip')
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            for filename in os.listdir(self.linkedin_export_dir):
+                archive.write(os.path.join(self.linkedin_export_dir, filename), f'Basic_LinkedInDataExport/{filename}')
+
+        outputs = []
+        for input_dir in (self.linkedin_export_dir, archive_path):
+            output_file = os.path.join(self.output_dir, f'output-{len(outputs)}.js')
+            results = run_import(input_dir, output_file, os.path.join(self.test_dir, f'constants-{len(outputs)}.json'))
+            self.assertFalse(results['projects'])
+            outputs.append(self.read_output_file(output_file))
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn('Test University', outputs[1])
+
+    def test_skills_custom_taxonomy(self):
+        # Test that skill categories come from a pluggable taxonomy file
+        self.create_test_csv('Skills.csv', ['Name'], [
+            {'Name': 'Kubernetes'},
+            {'Name': 'React Native'},
+            {'Name': 'Docker Compose'},
+            {'Name': 'Figma'},
+            {'Name': 'Rust (Programming Language)'},
+        ])
+        taxonomy_file = os.path.join(self.test_dir, 'taxonomy.json')
+        with open(taxonomy_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'categories': [
+                    {'title': 'Frameworks', 'id_prefix': 'f', 'icon': 'simple-icons', 'keywords': ['react']},
+                    {'title': 'DevOps', 'id_prefix': 'd', 'icon': 'placeholder',
+                     'keywords': ['kubernetes', 'docker', 'compose']},
+                ],
+                'default_category': {'title': 'Other', 'id_prefix': 'o', 'icon': 'placeholder'},
+            }, f)
+
+        categories, js_code = build_skills_section(self.linkedin_export_dir, taxonomy_file)
+        self.assertEqual([category['title'] for category in categories],
+                         ['Programming Languages', 'Frameworks', 'DevOps', 'Other'])
+        self.assertEqual([item['name'] for item in categories[2]['items']], ['Kubernetes', 'Docker Compose'])
+        self.assertEqual(categories[2]['items'][1]['id'], 'd-2')
+        self.assertEqual(categories[1]['items'][0]['icon'], 'SiReactnative')
+        self.assertEqual(categories[3]['items'][0], {'id': 'o-1', 'icon': 'FaRegImage', 'name': 'Figma'})
+        self.assertIn('title: "DevOps"', js_code)
+
     def test_missing_input_file(self):
         # Test handling of missing input file
         result = convert_education_csv_to_js('/nonexistent/dir')
@@ -608,11 +722,701 @@ class TestLinkedInImport(unittest.TestCase):
         self.assertIn('export const educationList', output)
         self.assertIn('[\n\n]', output)
 
+    def test_run_import_writes_all_sections_once(self):
+        # Test that the batched import splices every section into one file
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Profile.csv', ['First Name', 'Last Name', 'Headline'],
+                             [{'First Name': 'John', 'Last Name': 'Doe', 'Headline': 'Engineer'}])
+        output_file = os.path.join(self.output_dir, 'test-output.js')
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('export const educationList = [\n];\n\nexport const stats = [];\n')
+
+        results = run_import(self.linkedin_export_dir, output_file, json_file)
+        self.assertEqual(results['educationList'][0][0]['title'], 'Test University')
+        self.assertFalse(results['projects'])
+
+        output = self.read_output_file(output_file)
+        self.assertEqual(output.count('export const educationList'), 1)
+        self.assertIn('export const stats = [];', output)
+        self.assertIn('export const aboutMe', output)
+        self.assertIn('Test University', output)
+        self.assertTrue(os.path.exists(json_file))
+
+        # No temp files are left behind by the atomic write
+        self.assertEqual(sorted(os.listdir(self.output_dir)), ['test-output.js'])
+
+    def test_serial_import_streams_sections_into_js_file(self):
+        # Test that sections rendered straight into the file match the rendered strings spliced in
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Git'}])
+        existing = 'import x from "y";\n\nexport const educationList = [\n];\n\nexport const stats = [];\n'
+        outputs = []
+        for incremental in (False, True):
+            output_file = os.path.join(self.output_dir, f'output-{incremental}.js')
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(existing)
+            results = run_import(self.linkedin_export_dir, output_file,
+                                 os.path.join(self.test_dir, f'constants-{incremental}.json'), incremental=incremental)
+            self.assertEqual(results['educationList'][1] is None, not incremental)
+            outputs.append(self.read_output_file(output_file))
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn('export const stats = [];', outputs[0])
+        self.assertIn('Test University', outputs[0])
+
+    def test_incremental_import_skips_unchanged_sections(self):
+        # Test that an incremental run only rebuilds sections whose CSV changed
+        education_headers = ['School Name', 'Start Date', 'End Date']
+        self.create_test_csv('Education.csv', education_headers,
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Git'}])
+        output_file = os.path.join(self.output_dir, 'test-output.js')
+        json_file = os.path.join(self.test_dir, 'constants.json')
+
+        first = run_import(self.linkedin_export_dir, output_file, json_file, incremental=True)
+        self.assertTrue(first['educationList'])
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'constants.manifest.json')))
+
+        # Nothing changed: no section is rebuilt and no file is rewritten
+        js_mtime = os.stat(output_file).st_mtime_ns
+        json_mtime = os.stat(json_file).st_mtime_ns
+        second = run_import(self.linkedin_export_dir, output_file, json_file, incremental=True)
+        self.assertTrue(all(result is None for result in second.values()))
+        self.assertEqual(os.stat(output_file).st_mtime_ns, js_mtime)
+        self.assertEqual(os.stat(json_file).st_mtime_ns, json_mtime)
+
+        # Only the changed CSV is re-parsed
+        self.create_test_csv('Education.csv', education_headers,
+                             [{'School Name': 'Other College', 'Start Date': '2019', 'End Date': '2023'}])
+        third = run_import(self.linkedin_export_dir, output_file, json_file, incremental=True)
+        self.assertTrue(third['educationList'])
+        self.assertIsNone(third['skills'])
+        output = self.read_output_file(output_file)
+        self.assertIn('Other College', output)
+        self.assertNotIn('Test University', output)
+        self.assertIn('name: "Git"', output)
+
+    def test_parallel_import_matches_serial(self):
+        # Test that --jobs produces byte-identical output to a serial run
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Positions.csv', ['Company Name', 'Title', 'Started On', 'Finished On', 'Description'],
+                             [{'Company Name': 'Tech Corp', 'Title': 'Engineer', 'Started On': 'Jan 2022',
+                               'Finished On': '', 'Description': 'Built things. Fixed things.'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Python (Programming Language)'}, {'Name': 'Git'}])
+
+        outputs = []
+        for jobs in (1, 4):
+            output_file = os.path.join(self.output_dir, f'output-{jobs}.js')
+            json_file = os.path.join(self.test_dir, f'constants-{jobs}.json')
+            run_import(self.linkedin_export_dir, output_file, json_file, jobs=jobs)
+            with open(json_file, 'r', encoding='utf-8') as f:
+                outputs.append((self.read_output_file(output_file), f.read()))
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_run_report_records_stages(self):
+        # Test that a profiled import times every stage and exports them
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'},
+                              {'School Name': 'Other College', 'Start Date': '2016', 'End Date': '2020'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Python (Programming Language)'}, {'Name': 'Git'}])
+
+        output_file = os.path.join(self.output_dir, 'test-output.js')
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        for jobs in (1, 2):
+            report = RunReport()
+            run_import(self.linkedin_export_dir, output_file, json_file, jobs=jobs, report=report)
+
+            stages = {(record['section'], record['stage']): record for record in report.stages}
+            for stage in ('csv_open', 'parse', 'transform', 'render'):
+                self.assertIn(('educationList', stage), stages)
+                self.assertIn(('skills', stage), stages)
+            self.assertEqual(stages[('educationList', 'parse')]['rows'], 2)
+            self.assertGreater(stages[('educationList', 'csv_open')]['bytes_read'], 0)
+            self.assertGreater(stages[('all', 'splice_write')]['bytes_written'], 0)
+            self.assertIn(('all', 'update_json_file'), stages)
+
+        report_file = os.path.join(self.test_dir, 'report.json')
+        report.write(report_file)
+        with open(report_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['stages'], report.stages)
+        with open(os.path.join(self.test_dir, 'report.prom'), 'r', encoding='utf-8') as f:
+            self.assertIn('linkedin_import_stage_rows{section="educationList",stage="parse"} 2\n', f.read())
+
+        # Sections streamed into the file during splice_write are not counted twice
+        render = bulk_import.write_section_js
+
+        def slow_render(*args):
+            time.sleep(0.2)
+            render(*args)
+
+        report = RunReport()
+        with mock.patch.object(bulk_import, 'write_section_js', slow_render):
+            run_import(self.linkedin_export_dir, output_file, json_file, report=report)
+        stages = {(record['section'], record['stage']): record for record in report.stages}
+        self.assertGreaterEqual(stages[('educationList', 'render')]['seconds'], 0.2)
+        self.assertLess(stages[('all', 'splice_write')]['seconds'], 0.2)
+
+    def test_js_string_escaping(self):
+        # Quotes, backslashes and newlines must not break the JS string literals
+        title = 'Path C:\\new "quoted"\nsecond line'
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': title, 'Start Date': '2020', 'End Date': '2024'}])
+        result = build_section('educationList', self.linkedin_export_dir)
+        entries, js_code = result
+
+        literal = js_code.split('title: ', 1)[1].split(',\n', 1)[0]
+        self.assertEqual(json.loads(literal), title)
+
+        # The same export can be streamed straight to a file handle
+        output_file = os.path.join(self.output_dir, 'streamed.js')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            write_section_js('educationList', entries, f)
+        self.assertEqual(self.read_output_file(output_file), js_code)
+
+    def test_json_update_copies_untouched_sections(self):
+        # Untouched sections are copied through verbatim; only given ones are re-serialized
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        with open(json_file, 'w', encoding='utf-8') as f:
+            f.write('{\n    "custom": [1,  2, {"keep": "as is"}],\n    "skills": []\n}')
+
+        update_json_file(json_file=json_file, skills_categories=[{'title': 'Tools', 'items': []}])
+        with open(json_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('"custom": [1,  2, {"keep": "as is"}],', content)
+        data = json.loads(content)
+        self.assertEqual(list(data)[:2], ['custom', 'skills'])
+        self.assertEqual(data['skills'], [{'title': 'Tools', 'items': []}])
+        self.assertEqual(data['itemsToFetch'], 20)
+
+        # Compact mode rewrites every section without indentation
+        update_json_file(json_file=json_file, compact=True)
+        with open(json_file, 'r', encoding='utf-8') as f:
+            compact = f.read()
+        self.assertEqual(compact, json.dumps(data, separators=(',', ':')))
+
+    def test_compress_artifacts_skips_unchanged(self):
+        # Compressed variants are written once and only rewritten when content changes
+        paths = []
+        for name in ('data.js', 'data.json'):
+            path = os.path.join(self.output_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('export const skills = [];\n' * 50)
+            paths.append(path)
+
+        results = compress_artifacts(paths, jobs=2)
+        self.assertEqual(sorted(results), sorted(path + suffix for path in paths for suffix in ARTIFACT_ENCODINGS))
+        self.assertTrue(all(results.values()))
+        with gzip.open(paths[0] + '.gz', 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'export const skills = [];\n' * 50)
+
+        self.assertFalse(any(compress_artifacts(paths).values()))
+
+        with open(paths[1], 'a', encoding='utf-8') as f:
+            f.write('// changed\n')
+        results = compress_artifacts(paths)
+        self.assertTrue(results[paths[1] + '.gz'])
+        self.assertFalse(results[paths[0] + '.gz'])
+
+    def test_batch_import_from_manifest(self):
+        # Test that a batch manifest imports every profile like a single run would
+        exports_dir = os.path.join(self.test_dir, 'exports')
+        generate_export(os.path.join(exports_dir, 'alice'), 20, seed=1)
+        generate_export(os.path.join(exports_dir, 'bob'), 20, seed=2)
+        manifest_file = os.path.join(self.test_dir, 'batch.json')
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'input': 'exports/alice', 'output': 'out/alice/index.js'},
+                {'input': 'exports/bob', 'output': 'out/bob/index.js', 'json_output': 'out/bob.json'},
+                {'input': 'exports/nobody', 'output': 'out/nobody/index.js'},
+            ], f)
+
+        batch_jobs = find_batch_jobs(manifest_file)
+        self.assertEqual([job.profile for job in batch_jobs], ['alice', 'bob', 'nobody'])
+        self.assertEqual(batch_jobs[0].json_file, os.path.join(self.test_dir, 'out', 'alice', 'constants.json'))
+
+        summary = run_batch(batch_jobs, jobs=2)
+        self.assertEqual([status for _, status, _ in summary], ['ok', 'ok', 'failed'])
+        self.assertFalse(os.path.exists(batch_jobs[2].json_file))
+
+        # A batch directory skips folders without CSVs and the output directory inside it
+        os.makedirs(os.path.join(exports_dir, 'notes'))
+        output_dir = os.path.join(exports_dir, 'batch')
+        generate_export(output_dir, 5, seed=3)
+        directory_jobs = find_batch_jobs(exports_dir, output_dir)
+        self.assertEqual([job.profile for job in directory_jobs], ['alice', 'bob'])
+
+        output_file = os.path.join(self.output_dir, 'bob.js')
+        json_file = os.path.join(self.test_dir, 'bob.json')
+        run_import(os.path.join(exports_dir, 'bob'), output_file, json_file)
+        self.assertEqual(self.read_output_file(batch_jobs[1].output_file), self.read_output_file(output_file))
+        with open(batch_jobs[1].json_file, 'r', encoding='utf-8') as batch, \
+                open(json_file, 'r', encoding='utf-8') as single:
+            self.assertEqual(batch.read(), single.read())
+
+    def test_watch_regenerates_changed_sections(self):
+        # Test that watch mode rebuilds only the sections whose CSV changed
+        self.create_test_csv('Education.csv', ['School Name', 'Start Date', 'End Date'],
+                             [{'School Name': 'Test University', 'Start Date': '2020', 'End Date': '2024'}])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Git'}])
+        output_file = os.path.join(self.output_dir, 'test-output.js')
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        run_import(self.linkedin_export_dir, output_file, json_file)
+        with open(json_file, 'r', encoding='utf-8') as f:
+            education = json.load(f)['educationList']
+
+        stop_event = threading.Event()
+        watcher = threading.Thread(target=watch_export, args=(self.linkedin_export_dir, output_file, json_file),
+                                   kwargs={'stop_event': stop_event, 'interval': 0.01, 'debounce': 0.01})
+        watcher.start()
+        try:
+            time.sleep(0.05)
+            self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Git'}, {'Name': 'Docker'}])
+            deadline = time.time() + 5
+            while 'Docker' not in (self.read_output_file(output_file) or '') and time.time() < deadline:
+                time.sleep(0.01)
+
+            # A deleted CSV leaves its sections alone
+            os.remove(os.path.join(self.linkedin_export_dir, 'Education.csv'))
+            time.sleep(0.05)
+            self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Git'}, {'Name': 'Docker'}, {'Name': 'Rust'}])
+            deadline = time.time() + 5
+            while 'Rust' not in (self.read_output_file(output_file) or '') and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+        finally:
+            stop_event.set()
+            watcher.join()
+
+        self.assertIn('name: "Rust"', self.read_output_file(output_file))
+        self.assertIn('title: "Test University"', self.read_output_file(output_file))
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(len(data['skills'][0]['items']), 3)
+        self.assertEqual(data['educationList'], education)
+        self.assertEqual(changed_sections({'Skills.csv': (1, 2)}, {'Skills.csv': (1, 3)}), ['skills'])
+
+    def test_import_service(self):
+        # Test that the service returns what a direct import writes, and coalesces identical jobs
+        export_dir = generate_export(os.path.join(self.test_dir, 'export'), 300, seed=3)
+        output_file = os.path.join(self.output_dir, 'direct.js')
+        json_file = os.path.join(self.test_dir, 'direct.json')
+        run_import(export_dir, output_file, json_file)
+
+        service = ImportService(workers=2)
+        server = create_import_server(service, port=0)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            connection = http.client.HTTPConnection(*server.server_address[:2])
+            connection.request('POST', '/import', json.dumps({'input': export_dir}),
+                               {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            payload = json.loads(response.read())
+            self.assertEqual(payload['js'], self.read_output_file(output_file))
+            with open(json_file, 'r', encoding='utf-8') as f:
+                self.assertEqual(payload['json'], json.load(f))
+            self.assertEqual(payload['missing'], [])
+
+            # Valid JSON that is not an {"input": path} object is a bad request
+            for body in ('[]', '"x"', '{"input": 5}'):
+                connection.request('POST', '/import', body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                response.read()
+                self.assertEqual(response.status, 400, body)
+
+            # Concurrent requests for the same input share one job
+            submitted = []
+            apply_async = service.pool.apply_async
+            service.pool.apply_async = lambda *args: submitted.append(args) or apply_async(*args)
+            input_hash = hash_export(export_dir)
+            results = []
+            workers = [threading.Thread(target=lambda: results.append(service.run(input_hash, export_dir)))
+                       for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            self.assertEqual(len(results), 4)
+            self.assertLess(len(submitted), 4)
+            self.assertTrue(all(result == results[0] for result in results))
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            service.close()
+
+    def test_merge_keeps_curated_fields_and_emits_patch(self):
+        # Test that --merge upserts by key and the JSON Patch turns the old file into the new one
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({'experiences': [
+                {'organisation': 'Tech Corp', 'logo': 'techcorp.png', 'link': 'https://tech.example',
+                 'positions': []},
+                {'organisation': 'Hand Added', 'logo': 'placeholder', 'link': '', 'positions': []},
+            ]}, f, indent=4)
+        with open(json_file, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+
+        imported = [
+            {'organisation': 'New Co', 'logo': 'placeholder', 'link': '', 'positions': []},
+            {'organisation': 'Tech Corp', 'logo': 'placeholder', 'link': '',
+             'positions': [{'title': 'Engineer', 'duration': '', 'content': []}]},
+        ]
+        patch_file = os.path.join(self.test_dir, 'patch.json')
+        patch = update_json_file(experience_entries=imported, json_file=json_file, merge=True,
+                                 patch_file=patch_file)
+
+        with open(json_file, 'r', encoding='utf-8') as f:
+            new = json.load(f)
+        self.assertEqual([entry['organisation'] for entry in new['experiences']],
+                         ['New Co', 'Tech Corp', 'Hand Added'])
+        self.assertEqual(new['experiences'][1]['logo'], 'techcorp.png')
+        self.assertEqual(new['experiences'][1]['link'], 'https://tech.example')
+        self.assertEqual(len(new['experiences'][1]['positions']), 1)
+
+        with open(patch_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), patch)
+        for operation in patch:
+            *parents, last = [token.replace('~1', '/').replace('~0', '~')
+                              for token in operation['path'].split('/')[1:]]
+            target = old
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            key = int(last) if isinstance(target, list) else last
+            if operation['op'] == 'remove':
+                del target[key]
+            elif operation['op'] == 'add' and isinstance(target, list):
+                target.insert(key, operation['value'])
+            else:
+                target[key] = operation['value']
+        self.assertEqual(old, new)
+
+    def test_merge_keeps_nested_curated_fields(self):
+        # Test that --merge keeps curated fields inside nested record lists
+        existing = [{'title': 'Tools', 'items': [
+            {'id': 'skill-1', 'icon': 'SiDocker', 'name': 'Docker'},
+            {'id': 'skill-2', 'icon': 'SiRust', 'name': 'Hand Added'},
+        ]}]
+        imported = [{'title': 'Tools', 'items': [
+            {'id': 'skill-1', 'icon': 'FaRegImage', 'name': 'Python'},
+            {'id': 'skill-2', 'icon': 'FaRegImage', 'name': 'Docker'},
+        ]}]
+        items = merge_section('skills', existing, imported)[0]['items']
+        self.assertEqual([(item['name'], item['icon']) for item in items],
+                         [('Python', 'FaRegImage'), ('Docker', 'SiDocker'), ('Hand Added', 'SiRust')])
+
+        existing = [{'organisation': 'Tech Corp', 'logo': 'placeholder', 'link': '', 'positions': [
+            {'title': 'Engineer', 'duration': '2020', 'content': [
+                {'text': 'Built things', 'link': 'https://example.com'},
+                {'text': 'Old sentence', 'link': ''},
+            ]},
+        ]}]
+        imported = [{'organisation': 'Tech Corp', 'logo': 'placeholder', 'link': '', 'positions': [
+            {'title': 'Engineer', 'duration': '2020 - 2022', 'content': [
+                {'text': 'Built things', 'link': ''},
+                {'text': 'New sentence', 'link': ''},
+            ]},
+        ]}]
+        position = merge_section('experiences', existing, imported)[0]['positions'][0]
+        self.assertEqual(position['duration'], '2020 - 2022')
+        self.assertEqual(position['content'], [{'text': 'Built things', 'link': 'https://example.com'},
+                                               {'text': 'New sentence', 'link': ''}])
+
+    def test_stable_ids_and_fragment_cache(self):
+        # Test that content-addressed IDs survive an inserted row and cached fragments are reused
+        rows = [{'Title': 'First', 'Description': 'One.', 'Url': ''},
+                {'Title': 'Second', 'Description': 'Two.', 'Url': ''}]
+        self.create_test_csv('Projects.csv', ['Title', 'Description', 'Url'], rows)
+        cache_dir = os.path.join(self.test_dir, 'fragments')
+        before, js_before = build_section('projects', self.linkedin_export_dir, stable_ids=True,
+                                          fragment_cache=cache_dir)
+
+        self.create_test_csv('Projects.csv', ['Title', 'Description', 'Url'],
+                             [{'Title': 'Inserted', 'Description': '', 'Url': ''}] + rows)
+        cache = FragmentCache(cache_dir)
+        after = build_section('projects', self.linkedin_export_dir, stable_ids=True)[0]
+        js_after = render_section_js('projects', after, cache)
+        self.assertEqual([entry['id'] for entry in after[1:]], [entry['id'] for entry in before])
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertIn(js_before.split('\n', 1)[1].rsplit('\n', 2)[0], js_after)
+        self.assertEqual(js_after, render_section_js('projects', after))
+
+        # Identical records still get distinct IDs
+        self.create_test_csv('Projects.csv', ['Title', 'Description', 'Url'], rows + rows)
+        duplicated = build_section('projects', self.linkedin_export_dir, stable_ids=True)[0]
+        self.assertEqual(len({entry['id'] for entry in duplicated}), 4)
+
+        # Positional IDs would serve fragments rendered for other content
+        csv_text = 'Title,Description,Url\nOld,Desc,\n'
+        with self.assertRaises(ValueError):
+            convert_rows('projects', csv_text, fragment_cache=cache_dir)
+        with self.assertRaises(ValueError):
+            build_section('projects', self.linkedin_export_dir, fragment_cache=cache_dir)
+        with self.assertRaises(ValueError):
+            run_import(self.linkedin_export_dir, os.path.join(self.output_dir, 'index.js'),
+                       os.path.join(self.test_dir, 'constants.json'),
+                       builder_options={'projects': {'fragment_cache': cache_dir}})
+        result = convert_rows('projects', csv_text.replace('Old,Desc', 'New,Other'), fragment_cache=cache_dir,
+                              stable_ids=True)
+        self.assertEqual(result.data[0]['title'], 'New')
+        self.assertIn('title: "New"', result.js_code)
+
+    def test_modules_dir_writes_section_modules_and_barrel(self):
+        # Test that each section becomes an ES module importing what it uses, plus a barrel
+        self.create_test_csv('Projects.csv', ['Title', 'Description', 'Url'],
+                             [{'Title': 'Portfolio', 'Description': 'Site.', 'Url': ''}])
+        output_file = os.path.join(self.output_dir, 'index.js')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('import { placeholder, logo as brand } from "../assets";\n'
+                    'import { FaRegImage } from "react-icons/fa";\n\nexport const navLinks = [];\n')
+        modules_dir = os.path.join(self.output_dir, 'sections')
+        run_import(self.linkedin_export_dir, output_file, os.path.join(self.test_dir, 'constants.json'),
+                   modules_dir=modules_dir)
+
+        module = self.read_output_file(os.path.join(modules_dir, 'projects.js'))
+        self.assertTrue(module.startswith('import { placeholder } from "../../assets";\n'
+                                          'import { FaRegImage } from "react-icons/fa";\n\n'
+                                          'export const projects = ['))
+        self.assertEqual(self.read_output_file(os.path.join(modules_dir, 'index.js')),
+                         'export { projects } from "./projects.js";\n')
+        self.assertNotIn('export const projects', self.read_output_file(output_file))
+
+    def test_row_cache_matches_csv_parsing(self):
+        # Test that sections built from the memory-mapped row table match the CSV, cold and warm
+        self.create_test_csv('Honors.csv', ['Title', 'Description', 'Issued On'], [
+            {'Title': 'Award', 'Description': 'First. Second.', 'Issued On': 'Jan 2020'},
+            {'Title': 'Award', 'Description': '', 'Issued On': ''},
+        ])
+        row_cache = os.path.join(self.test_dir, 'rows')
+        expected = build_section('achievements', self.linkedin_export_dir)
+        self.assertEqual(build_section('achievements', self.linkedin_export_dir, row_cache=row_cache), expected)
+        self.assertEqual(build_section('achievements', self.linkedin_export_dir, row_cache=row_cache), expected)
+
+        cached, = os.listdir(row_cache)
+        table = load_row_table(os.path.join(row_cache, cached))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(len(table.strings), 4)
+        self.assertEqual(list(table.rows())[1], {'Title': 'Award', 'Description': '', 'Issued On': ''})
+
+        # Positions and skills read the table's columns; a warm run does not open the CSV
+        self.create_test_csv('Positions.csv', ['Company Name', 'Title', 'Description', 'Started On', 'Finished On'], [
+            {'Company Name': ' Acme ', 'Title': 'Engineer', 'Description': 'Built it.',
+             'Started On': 'Jan 2020', 'Finished On': ''},
+            {'Company Name': 'Acme', 'Title': 'Intern', 'Description': '', 'Started On': 'Jan 2019',
+             'Finished On': 'Dec 2019'},
+        ])
+        self.create_test_csv('Skills.csv', ['Name'], [{'Name': 'Python (Programming Language)'}, {'Name': ' Git '}])
+        for name in ('experiences', 'skills'):
+            expected = build_section(name, self.linkedin_export_dir)
+            self.assertEqual(build_section(name, self.linkedin_export_dir, row_cache=row_cache), expected)
+            report = RunReport()
+            self.assertEqual(build_section(name, self.linkedin_export_dir, report, row_cache=row_cache), expected)
+            stages = [record['stage'] for record in report.stages]
+            self.assertIn('row_table', stages)
+            self.assertNotIn('csv_open', stages)
+        self.assertEqual(list(table.column('Missing')), ['', ''])
+
+        # Ragged rows fall back to csv.DictReader
+        with open(os.path.join(self.test_dir, 'ragged.csv'), 'w+', encoding='utf-8') as f:
+            f.write('Title,Description\nOnly title\n')
+            f.seek(0)
+            self.assertIsNone(parse_row_table(f))
+
+    def test_section_records(self):
+        # Test that entries are slotted records that serialize and compare like the old dicts
+        self.create_test_csv('Projects.csv', ['Title', 'Description', 'Url'],
+                             [{'Title': 'Portfolio', 'Description': 'My site.', 'Url': 'https://example.com'}])
+        entries, js_code = build_section('projects', self.linkedin_export_dir)
+        entry = entries[0]
+        self.assertIsInstance(entry, ProjectEntry)
+        self.assertFalse(hasattr(entry, '__dict__'))
+        expected = {
+            'id': 'project-1', 'title': 'Portfolio', 'github': 'https://example.com',
+            'link': 'https://example.com', 'image': 'placeholder', 'content': 'My site.',
+            'stack': [{'id': 'icon-1', 'icon': 'FaRegImage', 'name': 'Placeholder'}],
+        }
+        self.assertEqual(entry, expected)
+        self.assertEqual(dict(entry)['title'], 'Portfolio')
+        self.assertIs(type(entry.to_plain()['stack'][0]), dict)
+        self.assertEqual(entry.to_plain(), expected)
+        self.assertIn(entry.to_js(), js_code)
+
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        update_json_file(project_entries=entries, json_file=json_file)
+        with open(json_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['projects'], [expected])
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        # Test that identical output keeps its mtime and --check reports only real changes
+        self.create_test_csv('Honors.csv', ['Title', 'Description', 'Issued On'],
+                             [{'Title': 'Award', 'Description': 'Won.', 'Issued On': '2020'}])
+        output_file = os.path.join(self.output_dir, 'index.js')
+        json_file = os.path.join(self.test_dir, 'constants.json')
+        self.assertEqual(len(check_import(self.linkedin_export_dir, output_file, json_file)), 2)
+        self.assertFalse(os.path.exists(output_file))
+
+        run_import(self.linkedin_export_dir, output_file, json_file)
+        os.utime(output_file, (0, 0))
+        os.utime(json_file, (0, 0))
+        run_import(self.linkedin_export_dir, output_file, json_file)
+        self.assertEqual(os.path.getmtime(output_file), 0)
+        self.assertEqual(os.path.getmtime(json_file), 0)
+        self.assertEqual(check_import(self.linkedin_export_dir, output_file, json_file), [])
+
+        self.create_test_csv('Honors.csv', ['Title', 'Description', 'Issued On'],
+                             [{'Title': 'Prize', 'Description': 'Won.', 'Issued On': '2021'}])
+        self.assertEqual(check_import(self.linkedin_export_dir, output_file, json_file), [output_file, json_file])
+        self.assertEqual(os.path.getmtime(output_file), 0)
+
+        # Caches are not filled either
+        caches = {'row_cache': os.path.join(self.test_dir, 'rows'),
+                  'fragment_cache': os.path.join(self.test_dir, 'fragments'), 'stable_ids': True}
+        changed = check_import(self.linkedin_export_dir, output_file, json_file,
+                               builder_options={'achievements': caches})
+        self.assertEqual(changed, [output_file, json_file])
+        self.assertFalse(os.path.exists(caches['row_cache']))
+        self.assertFalse(os.path.exists(caches['fragment_cache']))
+
+    def test_section_index_ignores_strings_and_comments(self):
+        # Brackets and semicolons inside strings or comments must not end a section
+        content = (
+            'export const projects = [\n'
+            '  { content: "Uses arr[0]; then ]; again", note: `a ]; b` }, // ];\n'
+            '];\n\n'
+            '/* export const fake = []; */\n'
+            'export const itemsToFetch = 20\n'
+            'export const aboutMe = {\n  name: "{x};"\n};\n'
+        )
+        index = index_js_sections(content)
+        self.assertEqual(sorted(index), ['aboutMe', 'itemsToFetch', 'projects'])
+        start, end = index['projects']
+        self.assertTrue(content[start:end].endswith('// ];\n];'))
+        start, end = index['itemsToFetch']
+        self.assertEqual(content[start:end], 'export const itemsToFetch = 20')
+
+        spliced = splice_js_sections(content, {
+            'projects': 'export const projects = [\n];\n',
+            'skills': 'export const skills = [\n];\n',
+        })
+        self.assertTrue(spliced.startswith('export const projects = [\n];\n\n/* export'))
+        self.assertNotIn('then ];', spliced)
+        self.assertIn('name: "{x};"', spliced)
+        self.assertTrue(spliced.endswith('\n\nexport const skills = [\n];\n'))
+
+    def test_description_tokenizer(self):
+        # Test that abbreviations, decimals, versions and URLs do not split sentences
+        self.assertEqual(
+            split_sentences('Used tools e.g. Git and Docker. Shipped v1.2.3 to prod. Cut latency 3.5x'),
+            ['Used tools e.g. Git and Docker.', 'Shipped v1.2.3 to prod.', 'Cut latency 3.5x']
+        )
+        self.assertEqual(
+            split_sentences('See https://example.com/docs.html for details. Done.'),
+            ['See https://example.com/docs.html for details.', 'Done.']
+        )
+        self.assertEqual(split_sentences('Reduced latency to 20 ms.\nWrote docs'),
+                         ['Reduced latency to 20 ms.', 'Wrote docs'])
+        self.assertEqual(split_sentences('...'), [])
+        self.assertEqual(split_sentences(''), [])
+
+        # Plain prose splits on ". " alone; an abbreviation falls back to the full scan
+        self.assertEqual(split_sentences(' Led a team.  Shipped it . . Then left. '),
+                         ['Led a team.', 'Shipped it .', 'Then left.'])
+        self.assertEqual(split_sentences('Worked with Dr. Smith. Left'), ['Worked with Dr. Smith.', 'Left'])
+
+        # Bullet points take precedence over sentences when requested
+        self.assertEqual(split_description('• Built v2.0. Tested it\n• Shipped', bullets=True),
+                         ['Built v2.0. Tested it', 'Shipped'])
+        self.assertEqual(split_description('• One. Two', bullets=False), ['• One.', 'Two'])
+
+    def test_date_parsing(self):
+        # Test the locale-independent date parser and its sort keys
+        self.assertEqual(parse_date('Apr 2023'), datetime(2023, 4, 1))
+        self.assertEqual(parse_date(' apr  2023 '), datetime(2023, 4, 1))
+        self.assertIsNone(parse_date('April 2023'))
+        self.assertIsNone(parse_date('2023-04'))
+        self.assertIsNone(parse_date(''))
+
+        self.assertEqual(format_date('sep 2021'), 'Sep 2021')
+        self.assertEqual(format_date('Summer 2021'), 'Summer 2021')
+        self.assertEqual(format_date(''), '')
+
+        # Present positions sort after finished ones, undated ones first
+        keys = [
+            date_sort_key('Jan 2022', ''),
+            date_sort_key('Jan 2022', 'Mar 2023'),
+            date_sort_key('Dec 2021', 'Dec 2024'),
+            date_sort_key('', 'Jan 2020'),
+        ]
+        self.assertEqual(sorted(keys, reverse=True), keys)
+
+    def test_benchmark_workload(self):
+        # Test that the synthetic export is reproducible and every stage is timed
+        first = generate_export(os.path.join(self.test_dir, 'first'), 20, seed=7)
+        second = generate_export(os.path.join(self.test_dir, 'second'), 20, seed=7)
+        for filename in os.listdir(first):
+            with open(os.path.join(first, filename), encoding='utf-8') as a, \
+                    open(os.path.join(second, filename), encoding='utf-8') as b:
+                self.assertEqual(a.read(), b.read(), filename)
+
+        stages = run_workload(first, 20, measure_memory=False)
+        self.assertIn('convert_positions_csv_to_js', stages)
+        self.assertIn('update_json_file', stages)
+        self.assertEqual(stages['convert_skills_csv_to_js']['rows'], 20)
+        self.assertTrue(all(stage['seconds'] >= 0 for stage in stages.values()))
+
+    def test_benchmark_baseline_comparison(self):
+        # Test that only stages slower or larger than the threshold, or missing, regress
+        baseline = {
+            'convert_skills_csv_to_js': {'seconds': 1.0, 'rows': 10, 'peak_bytes': 1000},
+            'update_json_file': {'seconds': 1.0, 'rows': 10, 'peak_bytes': 1000},
+            'run_import': {'seconds': 0.001, 'rows': 10, 'peak_bytes': 1000},
+            'removed_stage': {'seconds': 1.0, 'rows': 10, 'peak_bytes': 1000},
+        }
+        stages = {
+            'convert_skills_csv_to_js': {'seconds': 1.2, 'rows': 10, 'peak_bytes': 1100},
+            'update_json_file': {'seconds': 0.9, 'rows': 10, 'peak_bytes': 2000},
+            'run_import': {'seconds': 0.003, 'rows': 10, 'peak_bytes': 1000},
+            'new_stage': {'seconds': 5.0, 'rows': 10, 'peak_bytes': 1000},
+        }
+        lines, regressions = compare_to_baseline(baseline, stages, threshold=0.25)
+        self.assertEqual(regressions, ['update_json_file', 'removed_stage'])
+        self.assertEqual(len(lines), 6)
+        self.assertIn('REGRESSED', lines[2])
+
     def test_default_paths(self):
         # Test that default paths are correctly set
         paths = get_default_paths()
         self.assertIn('input_dir', paths)
         self.assertIn('output', paths)
 
+class TestStreamConversion(unittest.TestCase):
+    """Conversions of CSVs held in memory, which need no temporary files"""
+
+    def test_convert_rows_from_text_bytes_and_dicts(self):
+        text = 'Title,Description,Issued On\r\nAward,Won it. Twice.,Jan 2020\r\n'
+        from_text = convert_rows('achievements', text)
+        self.assertEqual(from_text.data[0]['content2'], 'Twice.')
+        self.assertIn('event: "Award"', from_text.js_code)
+        self.assertEqual(convert_rows('achievements', text.encode('utf-8')), from_text)
+        self.assertEqual(convert_rows('achievements', io.StringIO(text)), from_text)
+        rows = [{'Title': 'Award', 'Description': 'Won it. Twice.', 'Issued On': 'Jan 2020'}]
+        self.assertEqual(convert_rows('achievements', rows), from_text)
+
+    def test_import_streams_without_sinks(self):
+        results = import_streams({'Skills.csv': 'Name\nGit\n', 'aboutMe': [{'First Name': 'Ada'}]})
+        self.assertEqual(list(results), ['aboutMe', 'skills'])
+        self.assertEqual(results['aboutMe'].data['name'], 'Ada')
+        self.assertEqual(results['skills'].data[0]['items'][0]['name'], 'Git')
+
+        with self.assertRaisesRegex(ValueError, 'Skill.csv, skill$'):
+            import_streams({'skill': 'Name\nGit\n', 'Skill.csv': 'Name\nGit\n', 'Skills.csv': ''})
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file